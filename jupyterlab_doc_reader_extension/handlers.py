@@ -1,68 +1,204 @@
+import hashlib
+import importlib
 import json
 import os
+import sys
 import tempfile
-import base64
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
+from urllib.parse import quote
 from io import BytesIO
 
 from jupyter_server.base.handlers import APIHandler
 from jupyter_server.utils import url_path_join
 import tornado
-
-# Reportlab imports (required for both DOCX and PPTX conversion)
-try:
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle, Image as RLImage
-    from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
-    from reportlab.lib import colors
-    from reportlab.pdfbase import pdfmetrics
-    from reportlab.pdfbase.ttfonts import TTFont
-    from reportlab.pdfgen import canvas
-    REPORTLAB_AVAILABLE = True
-except ImportError as e:
-    REPORTLAB_AVAILABLE = False
-    _reportlab_import_error = str(e)
-
-# python-docx for DOCX conversion
-try:
-    from docx import Document
-    from html import escape as html_escape
-    DOCX_AVAILABLE = True
-except ImportError as e:
-    Document = None
-    DOCX_AVAILABLE = False
-    _docx_import_error = str(e)
-
-# python-pptx for PPTX conversion
+from tornado.ioloop import IOLoop
+from tornado.iostream import StreamClosedError
+from tornado.log import app_log
+
+# Raw PDF bytes per streamed base64 chunk. A multiple of 57 (and therefore of 3)
+# so only the final chunk carries '=' padding and the concatenated output is
+# a single valid base64 string.
+PDF_CHUNK_SIZE = 57 * 1024
+
+# Unicode font registration state, shared by all conversions in the process
+_fonts_lock = threading.Lock()
+_font_pair = None  # (regular, bold) font names, set once registration has run
+
+# Conversions run on worker threads so the server's event loop stays responsive
+_conversion_executor = ThreadPoolExecutor(
+    max_workers=min(4, os.cpu_count() or 1),
+    thread_name_prefix='doc-reader-convert'
+)
+
+# Shared pool decoding PPTX pictures; Pillow releases the GIL while decoding
+_picture_executor = ThreadPoolExecutor(
+    max_workers=min(8, os.cpu_count() or 1),
+    thread_name_prefix='doc-reader-picture'
+)
+
+# English Metric Units per PDF point (914400 EMU per inch / 72 points per inch)
+EMU_PER_POINT = 12700
+
+# Directories searched for the Unicode fonts when they are not at their Debian paths
+_FONT_DIRS = (
+    '/usr/share/fonts',
+    '/usr/local/share/fonts',
+    os.path.expanduser('~/.local/share/fonts'),
+    os.path.expanduser('~/.fonts'),
+    os.path.join(sys.prefix, 'fonts'),  # conda
+    '/Library/Fonts',
+)
+
+# Resolution embedded DOCX images are resampled to at their displayed size
+IMAGE_DPI = 150
+
+# Single-pass XML escaping; the markup variant also turns newlines into <br/>
+_XML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+_MARKUP_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '\n': '<br/>'})
+
+# Style and font name fragments that mark a DOCX run as code/monospace
+_CODE_STYLE_KEYWORDS = ('code', 'verbatim', 'mono', 'console')
+_MONO_FONT_KEYWORDS = ('courier', 'consolas', 'mono', 'code')
+
+# SIMD-accelerated base64 encoder if available, otherwise binascii called
+# directly (what base64.b64encode wraps, minus its Python-level frame)
 try:
-    from pptx import Presentation
-    from pptx.util import Inches, Pt, Emu as PptxEmu
-    from pptx.enum.shapes import MSO_SHAPE_TYPE
-    from pptx.dml.color import RGBColor
-    PPTX_AVAILABLE = True
-except ImportError as e:
-    Presentation = None
-    PPTX_AVAILABLE = False
-    _pptx_import_error = str(e)
-
-# Pillow for image handling
+    from pybase64 import b64encode
+except ImportError:
+    from binascii import b2a_base64
+    b64encode = partial(b2a_base64, newline=False)
+
+# orjson serialises straight to bytes; stdlib json is the fallback
 try:
-    from PIL import Image as PILImage
-    PIL_AVAILABLE = True
+    from orjson import dumps as _json_dumps
 except ImportError:
-    PIL_AVAILABLE = False
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# Conversion libraries are imported on first use so server startup does not pay
+# for them. Each _load_* function checks a library once; the code using it then
+# imports the names it needs locally. Each *_AVAILABLE flag is None until its
+# loader has run, then True or False.
+_imports_lock = threading.Lock()
+REPORTLAB_AVAILABLE = None
+DOCX_AVAILABLE = None
+PPTX_AVAILABLE = None
+PIL_AVAILABLE = None
+_reportlab_import_error = None
+_docx_import_error = None
+_pptx_import_error = None
+
+# Clark-notation WordprocessingML tags and XPaths read while walking a DOCX body
+# (what docx.oxml.ns.qn returns, spelled out so they need no import)
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_P = _W_NS + 'p'
+_W_TBL = _W_NS + 'tbl'
+_W_IND = _W_NS + 'ind'
+_W_LEFT = _W_NS + 'left'
+_W_RFONTS = _W_NS + 'rFonts'
+_W_ASCII = _W_NS + 'ascii'
+_W_PBDR = _W_NS + 'pBdr'
+_W_BOTTOM = _W_NS + 'bottom'
+_W_TOP = _W_NS + 'top'
+_W_DRAWING = _W_NS + 'drawing'
+_R_EMBED = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed'
+_XPATH_BLIP = './/{http://schemas.openxmlformats.org/drawingml/2006/main}blip'
+
+
+def _import_modules(*module_names):
+    """Import the given modules. Returns (True, None) or (False, error message)."""
+    try:
+        for module_name in module_names:
+            importlib.import_module(module_name)
+    except ImportError as e:
+        return False, str(e)
+    return True, None
+
+
+def _load_reportlab() -> bool:
+    """Import reportlab (required for both DOCX and PPTX conversion)."""
+    global REPORTLAB_AVAILABLE, _reportlab_import_error
+    if REPORTLAB_AVAILABLE is None:
+        with _imports_lock:
+            if REPORTLAB_AVAILABLE is None:
+                REPORTLAB_AVAILABLE, _reportlab_import_error = _import_modules(
+                    'reportlab.platypus', 'reportlab.pdfgen.canvas', 'reportlab.pdfbase.ttfonts'
+                )
+    return REPORTLAB_AVAILABLE
+
+
+def _load_docx() -> bool:
+    """Import python-docx for DOCX conversion."""
+    global DOCX_AVAILABLE, _docx_import_error
+    if DOCX_AVAILABLE is None:
+        with _imports_lock:
+            if DOCX_AVAILABLE is None:
+                DOCX_AVAILABLE, _docx_import_error = _import_modules('docx')
+    return DOCX_AVAILABLE
+
+
+def _load_pptx() -> bool:
+    """Import python-pptx for PPTX conversion."""
+    global PPTX_AVAILABLE, _pptx_import_error
+    if PPTX_AVAILABLE is None:
+        with _imports_lock:
+            if PPTX_AVAILABLE is None:
+                PPTX_AVAILABLE, _pptx_import_error = _import_modules('pptx')
+    return PPTX_AVAILABLE
+
+
+def _load_pil() -> bool:
+    """Import Pillow for image handling."""
+    global PIL_AVAILABLE
+    if PIL_AVAILABLE is None:
+        with _imports_lock:
+            if PIL_AVAILABLE is None:
+                PIL_AVAILABLE = _import_modules('PIL.Image')[0]
+    return PIL_AVAILABLE
+
+
+@lru_cache(maxsize=256)
+def _hex_color(value: str):
+    """Parsed slide colour; a deck only uses a handful of distinct values."""
+    from reportlab.lib import colors
+    return colors.HexColor(value)
+
+
+class _PDFSink:
+    """
+    Write-only file object passed to reportlab as the PDF destination.
+    reportlab serialises the finished document and writes it in one call, so
+    keeping a reference to that data avoids the copy made by BytesIO.getvalue().
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data) -> int:
+        self._chunks.append(data)
+        return len(data)
+
+    def getvalue(self) -> bytes:
+        if len(self._chunks) == 1:
+            return self._chunks[0]
+        return b''.join(self._chunks)
 
 
 class DocumentConverterHandler(APIHandler):
     """Handler for converting documents (DOCX, DOC, RTF, PPTX, PPT) to PDF"""
 
     @tornado.web.authenticated
-    def post(self):
+    async def post(self):
         """
         Convert a document file to PDF and return as base64-encoded data.
         Expects JSON payload: {"path": "/path/to/document.docx"}
+        The base64 payload is streamed in chunks rather than built in memory.
+        With the query argument raw=1 the PDF bytes are returned directly as
+        application/pdf instead; errors are JSON in both modes.
         """
         try:
             data = self.get_json_body()
@@ -73,7 +209,7 @@ class DocumentConverterHandler(APIHandler):
 
             if not file_path:
                 self.set_status(400)
-                self.finish(json.dumps({"error": "No file path provided"}))
+                self.finish(_json_dumps({"error": "No file path provided"}))
                 return
 
             # Get the full path to the file
@@ -87,41 +223,34 @@ class DocumentConverterHandler(APIHandler):
             full_path = os.path.join(root_dir, file_path.lstrip('/'))
             self.log.debug(f"Full path: {full_path}")
 
-            if not os.path.exists(full_path):
+            # One stat call serves as the existence check and reports the size
+            try:
+                file_size = os.stat(full_path).st_size
+            except OSError:
                 self.set_status(404)
-                self.finish(json.dumps({"error": f"File not found: {file_path}"}))
+                self.finish(_json_dumps({"error": f"File not found: {file_path}"}))
                 return
+            self.log.debug(f"File size: {file_size} bytes")
 
             # Check file extension
-            ext = Path(full_path).suffix.lower()
+            ext = os.path.splitext(full_path)[1].lower()
             if ext not in ['.docx', '.doc', '.rtf', '.pptx', '.ppt']:
                 self.set_status(400)
-                self.finish(json.dumps({"error": f"Unsupported file type: {ext}"}))
+                self.finish(_json_dumps({"error": f"Unsupported file type: {ext}"}))
                 return
 
-            # Convert to PDF
+            # Convert to PDF off the event loop
             try:
-                pdf_data = self._convert_to_pdf(full_path)
+                pdf_data = await IOLoop.current().run_in_executor(
+                    _conversion_executor, self._convert_to_pdf, full_path
+                )
                 self.log.debug(f"PDF size: {len(pdf_data)} bytes")
-
-                # Encode as base64 for transmission
-                pdf_base64 = base64.b64encode(pdf_data).decode('utf-8')
-
-                response_data = {
-                    "success": True,
-                    "pdf_data": pdf_base64,
-                    "filename": Path(file_path).stem + ".pdf"
-                }
-
-                self.finish(json.dumps(response_data))
-                self.log.info(f"Conversion successful")
-
             except Exception as convert_error:
                 import traceback
                 error_traceback = traceback.format_exc()
                 self.log.error(f"Conversion error: {str(convert_error)}\n{error_traceback}")
                 self.set_status(500)
-                self.finish(json.dumps({
+                self.finish(_json_dumps({
                     "success": False,
                     "error": f"Conversion failed: {str(convert_error)}",
                     "error_type": type(convert_error).__name__,
@@ -129,13 +258,41 @@ class DocumentConverterHandler(APIHandler):
                     "file_path": file_path,
                     "full_path": full_path
                 }))
+                return
+
+            filename = Path(file_path).stem + ".pdf"
+
+            # Send the raw PDF bytes, skipping base64 and the JSON envelope.
+            # Tornado hands the buffer to the socket as-is, so nothing is copied
+            if self.get_query_argument('raw', '') == '1':
+                self.set_header("Content-Disposition", f"inline; filename*=UTF-8''{quote(filename)}")
+                self.finish(pdf_data, set_content_type="application/pdf")
+                self.log.info(f"Conversion successful")
+                return
+
+            # Stream the JSON envelope with base64 PDF data chunk by chunk
+            try:
+                self.set_header("Content-Type", "application/json")
+                self.write(b'{"success":true,"filename":' + _json_dumps(filename) + b',"pdf_data":"')
+                for chunk in _iter_chunks(pdf_data, PDF_CHUNK_SIZE):
+                    self.write(b64encode(chunk))
+                    await self.flush()
+                self.finish(b'"}')
+                self.log.info(f"Conversion successful")
+            except StreamClosedError:
+                self.log.warning(f"Client disconnected while streaming: {file_path}")
 
         except Exception as e:
             import traceback
             error_traceback = traceback.format_exc()
             self.log.error(f"Handler error: {str(e)}\n{error_traceback}")
+            if self._headers_written:
+                # Part of the stream is already sent, so a JSON error can no
+                # longer be delivered; closing tells the client it is incomplete
+                self.request.connection.close()
+                return
             self.set_status(500)
-            self.finish(json.dumps({
+            self.finish(_json_dumps({
                 "success": False,
                 "error": str(e),
                 "error_type": type(e).__name__,
@@ -148,7 +305,7 @@ class DocumentConverterHandler(APIHandler):
         Pure Python solution with no external system dependencies.
         Returns PDF data as bytes.
         """
-        ext = Path(input_path).suffix.lower()
+        ext = os.path.splitext(input_path)[1].lower()
 
         # Route to appropriate converter based on file type
         if ext == '.pptx':
@@ -173,33 +330,46 @@ class DocumentConverterHandler(APIHandler):
         Convert DOCX document to PDF using python-docx + reportlab.
         Preserves document structure: inline tables, bold/italic, lists, images.
         """
-        if not REPORTLAB_AVAILABLE:
+        if not _load_reportlab():
             raise Exception(
                 f"Required library reportlab not installed: {_reportlab_import_error}\n"
                 "Please install: pip install reportlab"
             )
-        if not DOCX_AVAILABLE:
+        if not _load_docx():
             raise Exception(
                 f"Required library python-docx not installed: {_docx_import_error}\n"
                 "Please install: pip install python-docx"
             )
+        _load_pil()  # Optional, images are skipped without it
 
         try:
+            from docx import Document
+            from reportlab.lib import colors
+            from reportlab.lib.pagesizes import letter
+            from reportlab.lib.units import inch
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, HRFlowable
+            from reportlab.platypus import Image as RLImage
+
             # Import docx internals for document order iteration
             from docx.text.paragraph import Paragraph as DocxParagraph
             from docx.table import Table as DocxTable
-            from docx.oxml.ns import qn
-            import io
+            from docx.enum.style import WD_STYLE_TYPE
 
             # Read the DOCX file
             doc = Document(input_path)
-            self.log.debug(f"Document loaded. Paragraphs: {len(doc.paragraphs)}, Tables: {len(doc.tables)}")
+            self.log.debug(f"Document loaded: {input_path}")
 
-            # Register Unicode fonts
-            self._register_unicode_fonts()
+            # Register Unicode fonts and get the font names to use
+            font_name, font_name_bold = self._register_unicode_fonts()
+
+            # A body without paragraphs or tables gets the prebuilt placeholder PDF
+            body = doc.element.body
+            if not any(child.tag in (_W_P, _W_TBL) for child in body.iterchildren()):
+                self.log.warning("Document has no paragraphs or tables, returning placeholder PDF")
+                return _empty_document_pdf(font_name, font_name_bold)
 
             # Create PDF in memory
-            pdf_buffer = BytesIO()
+            pdf_buffer = _PDFSink()
             pdf_doc = SimpleDocTemplate(
                 pdf_buffer,
                 pagesize=letter,
@@ -209,122 +379,23 @@ class DocumentConverterHandler(APIHandler):
                 bottomMargin=36
             )
 
-            # Get default styles
-            styles = getSampleStyleSheet()
-
-            # Determine which font to use (prefer Unicode fonts if registered)
-            font_name = 'UnicodeSans' if 'UnicodeSans' in pdfmetrics.getRegisteredFontNames() else 'Helvetica'
-            font_name_bold = 'UnicodeSansBold' if 'UnicodeSansBold' in pdfmetrics.getRegisteredFontNames() else 'Helvetica-Bold'
-
-            # Create custom styles matching document structure
-            normal_style = ParagraphStyle(
-                'CustomNormal',
-                parent=styles['Normal'],
-                fontName=font_name,
-                fontSize=10,
-                leading=12,
-                spaceAfter=6
-            )
-
-            # List styles with proper indentation
-            list_bullet_style = ParagraphStyle(
-                'CustomListBullet',
-                parent=styles['Normal'],
-                fontName=font_name,
-                fontSize=10,
-                leading=12,
-                spaceAfter=3,
-                leftIndent=18,
-                bulletIndent=6
-            )
-
-            list_bullet_2_style = ParagraphStyle(
-                'CustomListBullet2',
-                parent=styles['Normal'],
-                fontName=font_name,
-                fontSize=10,
-                leading=12,
-                spaceAfter=3,
-                leftIndent=36,
-                bulletIndent=24
-            )
-
-            list_number_style = ParagraphStyle(
-                'CustomListNumber',
-                parent=styles['Normal'],
-                fontName=font_name,
-                fontSize=10,
-                leading=12,
-                spaceAfter=3,
-                leftIndent=18,
-                bulletIndent=6
-            )
-
-            list_number_2_style = ParagraphStyle(
-                'CustomListNumber2',
-                parent=styles['Normal'],
-                fontName=font_name,
-                fontSize=10,
-                leading=12,
-                spaceAfter=3,
-                leftIndent=36,
-                bulletIndent=24
-            )
-
-            heading1_style = ParagraphStyle(
-                'CustomHeading1',
-                parent=styles['Heading1'],
-                fontName=font_name_bold,
-                fontSize=14,
-                leading=18,
-                spaceAfter=6,
-                spaceBefore=10,
-                textColor=colors.HexColor('#365F91')
-            )
-
-            heading2_style = ParagraphStyle(
-                'CustomHeading2',
-                parent=styles['Heading2'],
-                fontName=font_name_bold,
-                fontSize=12,
-                leading=15,
-                spaceAfter=4,
-                spaceBefore=8,
-                textColor=colors.HexColor('#4F81BD')
-            )
-
-            heading3_style = ParagraphStyle(
-                'CustomHeading3',
-                parent=styles['Heading3'],
-                fontName=font_name_bold,
-                fontSize=11,
-                leading=14,
-                spaceAfter=3,
-                spaceBefore=6,
-                textColor=colors.HexColor('#4F81BD')
-            )
-
-            # Code/monospace style for inline code and filenames
-            font_name_mono = 'Courier'
-            code_style = ParagraphStyle(
-                'CustomCode',
-                parent=styles['Normal'],
-                fontName=font_name_mono,
-                fontSize=9,
-                leading=11,
-                spaceAfter=4,
-                backColor=colors.HexColor('#f5f5f5'),
-                leftIndent=6,
-                rightIndent=6
-            )
+            # Reuse paragraph styles built once per font pair
+            styles = self._get_styles(font_name, font_name_bold)
+            normal_style = styles['normal']
+            list_bullet_style = styles['list_bullet']
+            list_bullet_2_style = styles['list_bullet_2']
+            list_number_style = styles['list_number']
+            list_number_2_style = styles['list_number_2']
+            heading1_style = styles['heading1']
+            heading2_style = styles['heading2']
+            heading3_style = styles['heading3']
+            table_style = styles['table']
 
             # Build the story (content) - iterate body elements in document order
             story = []
 
-            def get_list_info(para):
-                """Get list type and level from paragraph style and indentation."""
-                style_name = para.style.name if para.style else ''
-
+            def get_list_info(pPr, style_name):
+                """Get list type and level from paragraph style name and indentation."""
                 # Determine list type from style name
                 list_type = None
                 if 'List Number' in style_name:
@@ -337,7 +408,7 @@ class DocumentConverterHandler(APIHandler):
                 if list_type is None:
                     # Check numPr for lists without explicit style
                     try:
-                        if para._element.pPr is not None and para._element.pPr.numPr is not None:
+                        if pPr is not None and pPr.numPr is not None:
                             list_type = 'bullet'
                     except AttributeError:
                         pass
@@ -352,11 +423,10 @@ class DocumentConverterHandler(APIHandler):
                     # Check leftIndent for nesting level
                     level = 0
                     try:
-                        pPr = para._element.pPr
                         if pPr is not None:
-                            ind = pPr.find(qn('w:ind'))
+                            ind = pPr.find(_W_IND)
                             if ind is not None:
-                                left_val = ind.get(qn('w:left'))
+                                left_val = ind.get(_W_LEFT)
                                 if left_val:
                                     left_indent = int(left_val)
                                     # 720 twips = level 0, 1440+ = level 1+
@@ -368,215 +438,320 @@ class DocumentConverterHandler(APIHandler):
                 return (list_type, level)
 
             # Track numbering for ordered lists
-            number_counters = {0: 0, 1: 0, 2: 0}
+            number_counters = [0, 0, 0]
             last_list_level = -1
 
+            # Per-document memo of code detection, keyed by character style id and font name
+            code_style_cache = {}
+            code_font_cache = {}
+
             def is_code_run(run):
                 """Check if a run has code/monospace styling."""
                 try:
+                    r = run._element
+
                     # Check style name for code indicators
-                    if run.style and run.style.name:
-                        style_name = run.style.name.lower()
-                        if any(kw in style_name for kw in ['code', 'verbatim', 'mono', 'console']):
-                            return True
-
-                    # Check font name for monospace fonts
-                    if run.font and run.font.name:
-                        font_name_lower = run.font.name.lower()
-                        if any(kw in font_name_lower for kw in ['courier', 'consolas', 'mono', 'code']):
-                            return True
-
-                    # Check XML for rFonts element with monospace font
-                    rPr = run._element.rPr
+                    style_id = r.style
+                    is_code = code_style_cache.get(style_id)
+                    if is_code is None:
+                        style = run.style
+                        style_name = style.name.lower() if style is not None and style.name else ''
+                        is_code = any(kw in style_name for kw in _CODE_STYLE_KEYWORDS)
+                        code_style_cache[style_id] = is_code
+                    if is_code:
+                        return True
+
+                    # Check XML for rFonts element with monospace font (same value as run.font.name)
+                    rPr = r.rPr
                     if rPr is not None:
-                        rFonts = rPr.find(qn('w:rFonts'))
+                        rFonts = rPr.find(_W_RFONTS)
                         if rFonts is not None:
-                            ascii_font = rFonts.get(qn('w:ascii'))
+                            ascii_font = rFonts.get(_W_ASCII)
                             if ascii_font:
-                                font_lower = ascii_font.lower()
-                                if any(kw in font_lower for kw in ['courier', 'consolas', 'mono', 'code']):
-                                    return True
+                                is_code = code_font_cache.get(ascii_font)
+                                if is_code is None:
+                                    font_lower = ascii_font.lower()
+                                    is_code = any(kw in font_lower for kw in _MONO_FONT_KEYWORDS)
+                                    code_font_cache[ascii_font] = is_code
+                                return is_code
                 except (AttributeError, TypeError):
                     pass
                 return False
 
-            def is_horizontal_rule(para):
+            def is_horizontal_rule(pPr, raw_text):
                 """Check if paragraph represents a horizontal divider line."""
                 try:
                     # Check for paragraph border (horizontal line)
-                    pPr = para._element.pPr
                     if pPr is not None:
-                        pBdr = pPr.find(qn('w:pBdr'))
+                        pBdr = pPr.find(_W_PBDR)
                         if pBdr is not None:
                             # Check for bottom border which creates a horizontal line
-                            bottom = pBdr.find(qn('w:bottom'))
-                            top = pBdr.find(qn('w:top'))
+                            bottom = pBdr.find(_W_BOTTOM)
+                            top = pBdr.find(_W_TOP)
                             if bottom is not None or top is not None:
                                 # If paragraph is empty or just whitespace, it's a divider
-                                if not para.text.strip():
+                                if not raw_text or raw_text.isspace():
                                     return True
                 except (AttributeError, TypeError):
                     pass
                 return False
 
-            def process_paragraph(para):
-                """Process a single paragraph and return reportlab element(s)."""
+            # Heading styles by exact DOCX style name; other "Heading*" names fall back to level 3
+            heading_styles = {
+                'Heading 1': heading1_style,
+                'Heading 2': heading2_style,
+                'Heading 3': heading3_style,
+            }
+
+            # Paragraph style name and heading style resolved once per style id
+            paragraph_style_cache = {}
+
+            def get_paragraph_style(style_id):
+                """
+                Resolve a paragraph style id (default style when unset) to
+                (style_name, heading_style), heading_style being None for non-headings.
+                """
+                resolved = paragraph_style_cache.get(style_id)
+                if resolved is None:
+                    style = doc.part.get_style(style_id, WD_STYLE_TYPE.PARAGRAPH)
+                    style_name = style.name if style is not None and style.name else ''
+                    heading_style = heading_styles.get(style_name)
+                    if heading_style is None and style_name.startswith('Heading'):
+                        if style_name.startswith('Heading 1'):
+                            heading_style = heading1_style
+                        elif style_name.startswith('Heading 2'):
+                            heading_style = heading2_style
+                        else:
+                            heading_style = heading3_style
+                    resolved = (style_name, heading_style)
+                    paragraph_style_cache[style_id] = resolved
+                return resolved
+
+            # Single-fragment template per style for plain-text paragraphs
+            plain_frag_templates = {}
+
+            def make_paragraph(text, style, plain):
+                """
+                Build a Paragraph. Plain text (unescaped, no markup or line breaks)
+                is passed as a ready-made fragment, skipping reportlab's XML parser.
+                """
+                if not plain:
+                    return Paragraph(text, style)
+                template = plain_frag_templates.get(style)
+                if template is None:
+                    template = plain_frag_templates[style] = Paragraph('x', style).frags[0]
+                return Paragraph(text, style, frags=[template.clone(text=text)])
+
+            def process_paragraph(p, raw_text):
+                """
+                Process a single w:p element and return its reportlab flowable.
+                raw_text is the paragraph text, read once by the caller. The
+                python-docx Paragraph wrapper is only built when runs need inspecting.
+                """
                 nonlocal last_list_level
 
+                pPr = p.pPr
+
                 # Check for horizontal rule/divider first
-                if is_horizontal_rule(para):
-                    from reportlab.platypus import HRFlowable
-                    return [HRFlowable(width="100%", thickness=0.5, color=colors.grey, spaceBefore=3, spaceAfter=6)]
+                if is_horizontal_rule(pPr, raw_text):
+                    return HRFlowable(width="100%", thickness=0.5, color=colors.grey, spaceBefore=3, spaceAfter=6)
 
-                text = para.text.strip()
+                text = raw_text.strip()
                 if not text:
                     # Empty paragraph - render as actual blank line (not invisible spacer)
                     return Paragraph("&nbsp;", normal_style)
 
-                # Escape XML special characters for base text and convert newlines
-                text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                text = text.replace('\n', '<br/>')
+                # Single-line text without run formatting bypasses the markup parser
+                plain = '\n' not in text
 
                 # Process all runs with their formatting
                 def format_run(run):
-                    """Format a single run with all its styling."""
-                    run_text = run.text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+                    """
+                    Format a single run with all its styling in one pass.
+                    Returns (markup, formatted) where formatted tells whether any
+                    tag was applied to non-whitespace text.
+                    """
+                    run_text = run.text
                     if not run_text:
-                        return run_text
-
-                    # Convert newlines to HTML line breaks for reportlab
-                    run_text = run_text.replace('\n', '<br/>')
+                        return run_text, False
 
-                    result = run_text
+                    # Escape XML and convert newlines to HTML line breaks for reportlab
+                    run_text = run_text.translate(_MARKUP_ESCAPE)
+                    has_content = not run_text.isspace()
 
                     # Check for code/monospace first (takes precedence)
                     if is_code_run(run):
-                        result = f'<font face="Courier" size="9">{result}</font>'
-                        return result
-
-                    # Apply formatting tags (can be combined)
-                    if run.bold:
-                        result = f'<b>{result}</b>'
-                    if run.italic:
-                        result = f'<i>{result}</i>'
-                    if run.underline:
-                        result = f'<u>{result}</u>'
-                    if run.font.strike:
-                        result = f'<strike>{result}</strike>'
-                    if run.font.subscript:
-                        result = f'<sub>{result}</sub>'
-                    if run.font.superscript:
-                        result = f'<super>{result}</super>'
+                        return f'<font face="Courier" size="9">{run_text}</font>', has_content
+
+                    # Collect formatting tags (can be combined), innermost first
+                    font = run.font
+                    opens = []
+                    closes = []
+                    if font.bold:
+                        opens.append('<b>')
+                        closes.append('</b>')
+                    if font.italic:
+                        opens.append('<i>')
+                        closes.append('</i>')
+                    if font.underline:
+                        opens.append('<u>')
+                        closes.append('</u>')
+                    if font.strike:
+                        opens.append('<strike>')
+                        closes.append('</strike>')
+                    if font.subscript:
+                        opens.append('<sub>')
+                        closes.append('</sub>')
+                    if font.superscript:
+                        opens.append('<super>')
+                        closes.append('</super>')
 
                     # Check for text color
                     try:
-                        if run.font.color and run.font.color.rgb:
-                            color_hex = str(run.font.color.rgb)
+                        color = font.color
+                        if color and color.rgb:
+                            color_hex = str(color.rgb)
                             if color_hex and color_hex != 'None' and len(color_hex) == 6:
-                                result = f'<font color="#{color_hex}">{result}</font>'
+                                opens.append(f'<font color="#{color_hex}">')
+                                closes.append('</font>')
                     except (AttributeError, TypeError):
                         pass
 
-                    return result
+                    if not opens:
+                        return run_text, False
 
-                # Check if any run has formatting that needs processing
+                    return ''.join(reversed(opens)) + run_text + ''.join(closes), has_content
+
+                # Use run-level markup only when some run carries formatting,
+                # otherwise keep the plain paragraph text
+                formatted_parts = []
                 has_formatting = False
-                for run in para.runs:
-                    if run.text.strip():
-                        if (run.bold or run.italic or run.underline or
-                            run.font.strike or run.font.subscript or run.font.superscript or
-                            is_code_run(run)):
-                            has_formatting = True
-                            break
-                        try:
-                            if run.font.color and run.font.color.rgb:
-                                has_formatting = True
-                                break
-                        except (AttributeError, TypeError):
-                            pass
+                for run in DocxParagraph(p, doc).runs:
+                    markup, formatted = format_run(run)
+                    formatted_parts.append(markup)
+                    has_formatting = has_formatting or formatted
 
                 if has_formatting:
-                    formatted_parts = [format_run(run) for run in para.runs]
                     text = ''.join(formatted_parts)
+                    plain = False
+                elif not plain:
+                    # Escape XML special characters for base text and convert newlines
+                    text = text.translate(_MARKUP_ESCAPE)
 
                 # Detect heading styles
-                style_name = para.style.name if para.style else ''
-                if style_name.startswith('Heading 1'):
-                    last_list_level = -1
-                    return Paragraph(text, heading1_style)
-                elif style_name.startswith('Heading 2'):
+                style_name, heading_style = get_paragraph_style(pPr.style if pPr is not None else None)
+                if heading_style is not None:
                     last_list_level = -1
-                    return Paragraph(text, heading2_style)
-                elif style_name.startswith('Heading 3') or style_name.startswith('Heading'):
-                    last_list_level = -1
-                    return Paragraph(text, heading3_style)
+                    return make_paragraph(text, heading_style, plain)
 
                 # Check for list items
-                list_type, level = get_list_info(para)
+                list_type, level = get_list_info(pPr, style_name)
 
                 if list_type == 'number':
                     # Reset lower levels when moving up, increment current level
                     if level <= last_list_level:
-                        for l in range(level + 1, 3):
-                            number_counters[l] = 0
+                        number_counters[level + 1:] = [0] * (2 - level)
                     number_counters[level] += 1
                     last_list_level = level
 
                     prefix = f"{number_counters[level]}. "
                     style = list_number_2_style if level > 0 else list_number_style
-                    return Paragraph(f'{prefix}{text}', style)
+                    return make_paragraph(f'{prefix}{text}', style, plain)
 
                 elif list_type == 'bullet':
                     last_list_level = level
                     style = list_bullet_2_style if level > 0 else list_bullet_style
-                    return Paragraph(f'• {text}', style)
+                    return make_paragraph(f'• {text}', style, plain)
 
                 else:
                     # Reset counters when not in list
                     last_list_level = -1
-                    for l in number_counters:
-                        number_counters[l] = 0
-                    return Paragraph(text, normal_style)
+                    number_counters[:] = [0, 0, 0]
+                    return make_paragraph(text, normal_style, plain)
 
             def process_table(tbl):
                 """Process a single table and return reportlab elements."""
-                table_data = []
-                for row in tbl.rows:
-                    row_data = []
-                    for cell in row.cells:
-                        cell_text = cell.text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-                        row_data.append(cell_text)
-                    table_data.append(row_data)
+                # Merged cells repeat the same w:tc across grid positions, read each once
+                text_by_tc = {}
+
+                def cell_text(cell):
+                    tc = cell._tc
+                    text = text_by_tc.get(tc)
+                    if text is None:
+                        text = '\n'.join(p.text for p in cell.paragraphs).translate(_XML_ESCAPE)
+                        text_by_tc[tc] = text
+                    return text
+
+                table_data = [[cell_text(cell) for cell in row.cells] for row in tbl.rows]
 
                 if not table_data:
                     return []
 
                 t = Table(table_data, hAlign='LEFT')
-                t.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#dbe5f1')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#365F91')),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, 0), font_name_bold),
-                    ('FONTNAME', (0, 1), (-1, -1), font_name),
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-                    ('TOPPADDING', (0, 0), (-1, -1), 4),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#cccccc'))
-                ]))
+                t.setStyle(table_style)
                 return [t, Spacer(1, 0.15 * inch)]
 
+            # Resampled image data and drawn size keyed by content hash, so identical
+            # media (logos, icons) is decoded and resampled only once. Each occurrence
+            # still gets its own flowable: platypus marks a flowable it had to push to
+            # the next page and raises LayoutError if the same object is pushed again
+            image_cache = {}
+
+            def load_image(image_part):
+                """
+                Size an embedded image for the page and resample it to IMAGE_DPI
+                at that size, so oversized photos are not embedded at full resolution.
+                """
+                from PIL import Image as PILImage
+
+                image_bytes = image_part.blob
+                key = hashlib.blake2b(image_bytes, digest_size=16).digest()
+                cached = image_cache.get(key)
+                if cached is None:
+                    with PILImage.open(BytesIO(image_bytes)) as pil_image:
+                        # Scale image to fit page width (max 7 inches), 1 pixel = 1 point
+                        draw_width, draw_height = pil_image.size
+                        max_width = 7 * inch
+                        if draw_width > max_width:
+                            draw_height = draw_height * max_width / draw_width
+                            draw_width = max_width
+
+                        target_size = (
+                            max(1, int(draw_width / inch * IMAGE_DPI)),
+                            max(1, int(draw_height / inch * IMAGE_DPI))
+                        )
+                        if pil_image.width > target_size[0] or pil_image.height > target_size[1]:
+                            pil_image.thumbnail(target_size, PILImage.LANCZOS)
+                            out = BytesIO()
+                            if pil_image.mode in ('RGBA', 'LA', 'P'):
+                                # Keep transparency (and palettes) lossless
+                                pil_image.save(out, format='PNG')
+                            else:
+                                if pil_image.mode not in ('RGB', 'L'):
+                                    pil_image = pil_image.convert('RGB')
+                                pil_image.save(out, format='JPEG', quality=85)
+                            image_bytes = out.getvalue()
+                    cached = image_cache[key] = (image_bytes, draw_width, draw_height)
+                image_bytes, draw_width, draw_height = cached
+
+                img = RLImage(BytesIO(image_bytes), width=draw_width, height=draw_height)
+
+                # Left-align image
+                img.hAlign = 'LEFT'
+                return img
+
             def process_image(drawing_element, doc):
                 """Extract image from drawing element and return reportlab Image."""
                 if not PIL_AVAILABLE:
                     return None
                 try:
                     # Navigate to blip element containing image reference
-                    blip = drawing_element.find('.//' + qn('a:blip'))
+                    blip = drawing_element.find(_XPATH_BLIP)
                     if blip is None:
                         return None
 
                     # Get the relationship ID
-                    rId = blip.get(qn('r:embed'))
+                    rId = blip.get(_R_EMBED)
                     if not rId:
                         return None
 
@@ -585,72 +760,67 @@ class DocumentConverterHandler(APIHandler):
                     if not image_part:
                         return None
 
-                    # Create reportlab Image from bytes
-                    img_buffer = io.BytesIO(image_part.blob)
-                    img = RLImage(img_buffer)
-
-                    # Scale image to fit page width (max 7 inches)
-                    max_width = 7 * inch
-                    if img.drawWidth > max_width:
-                        scale = max_width / img.drawWidth
-                        img.drawWidth = max_width
-                        img.drawHeight = img.drawHeight * scale
-
-                    # Left-align image
-                    img.hAlign = 'LEFT'
-
-                    return img
+                    # Reuse the image data resampled for identical content
+                    return load_image(image_part)
                 except Exception as e:
                     self.log.debug(f"Error extracting image: {e}")
                     return None
 
-            def add_to_story(result):
-                """Add paragraph result to story, handling lists or single elements."""
-                if isinstance(result, list):
-                    story.extend(result)
-                else:
-                    story.append(result)
+            # Bucket drawings (images) by their top-level body element in one walk
+            drawings_by_element = defaultdict(list)
+            for drawing in body.iter(_W_DRAWING):
+                top = drawing
+                parent = top.getparent()
+                while parent is not body:
+                    top = parent
+                    parent = top.getparent()
+                drawings_by_element[top].append(drawing)
 
             # Iterate through body elements in document order (preserves table position)
             para_count = 0
             table_count = 0
-            for element in doc.element.body:
-                if element.tag == qn('w:p'):  # Paragraph
-                    para = DocxParagraph(element, doc)
+            w_p = _W_P
+            w_tbl = _W_TBL
+            story_append = story.append
+            story_extend = story.extend
+            for element in body.iterchildren():
+                tag = element.tag
+                if tag == w_p:  # Paragraph
                     para_count += 1
 
+                    raw_text = element.text
+
                     # Check for drawings (images) in paragraph
-                    drawings = element.findall('.//' + qn('w:drawing'))
+                    drawings = drawings_by_element.get(element)
                     if drawings:
                         # Process paragraph text first (if any)
-                        if para.text.strip():
-                            add_to_story(process_paragraph(para))
+                        if raw_text and not raw_text.isspace():
+                            story_append(process_paragraph(element, raw_text))
                         # Then add images
                         for drawing in drawings:
                             img = process_image(drawing, doc)
                             if img:
-                                story.append(img)
-                                story.append(Spacer(1, 0.1 * inch))
+                                story_append(img)
+                                story_append(Spacer(1, 0.1 * inch))
                     else:
-                        add_to_story(process_paragraph(para))
+                        story_append(process_paragraph(element, raw_text))
 
-                elif element.tag == qn('w:tbl'):  # Table
+                elif tag == w_tbl:  # Table
                     tbl = DocxTable(element, doc)
                     table_count += 1
-                    story.extend(process_table(tbl))
+                    story_extend(process_table(tbl))
 
             self.log.debug(f"Processed {para_count} paragraphs, {table_count} tables in document order")
 
             # Build the PDF
             if not story:
-                self.log.warning("Story is empty! Creating a placeholder PDF")
-                story.append(Paragraph("Document appears to be empty or contains no readable content.", normal_style))
+                self.log.warning("Story is empty! Returning placeholder PDF")
+                return _empty_document_pdf(font_name, font_name_bold)
 
             pdf_doc.build(story)
 
             # Get the PDF bytes
             pdf_bytes = pdf_buffer.getvalue()
-            pdf_buffer.close()
 
             return pdf_bytes
 
@@ -662,18 +832,22 @@ class DocumentConverterHandler(APIHandler):
         Convert PPTX presentation to PDF using python-pptx + reportlab.
         Renders each slide as a PDF page with text, shapes, and images.
         """
-        if not REPORTLAB_AVAILABLE:
+        if not _load_reportlab():
             raise Exception(
                 f"Required library reportlab not installed: {_reportlab_import_error}\n"
                 "Please install: pip install reportlab"
             )
-        if not PPTX_AVAILABLE:
+        if not _load_pptx():
             raise Exception(
                 f"Required library python-pptx not installed: {_pptx_import_error}\n"
                 "Please install: pip install python-pptx"
             )
+        _load_pil()  # Optional, pictures are skipped without it
 
         try:
+            from pptx import Presentation
+            from reportlab.pdfgen import canvas
+
             # Load the presentation
             prs = Presentation(input_path)
             self.log.debug(f"Presentation loaded. Slides: {len(prs.slides)}")
@@ -683,63 +857,31 @@ class DocumentConverterHandler(APIHandler):
             slide_height_emu = prs.slide_height
 
             # Convert EMU to points (1 inch = 914400 EMU, 1 inch = 72 points)
-            slide_width_pt = slide_width_emu / 914400 * 72
-            slide_height_pt = slide_height_emu / 914400 * 72
+            slide_width_pt = slide_width_emu / EMU_PER_POINT
+            slide_height_pt = slide_height_emu / EMU_PER_POINT
 
             self.log.debug(f"Slide size: {slide_width_pt:.1f} x {slide_height_pt:.1f} points")
 
-            # Register Unicode fonts (same as DOCX handler)
-            self._register_unicode_fonts()
-
-            # Determine which font to use
-            font_name = 'UnicodeSans' if 'UnicodeSans' in pdfmetrics.getRegisteredFontNames() else 'Helvetica'
-            font_name_bold = 'UnicodeSansBold' if 'UnicodeSansBold' in pdfmetrics.getRegisteredFontNames() else 'Helvetica-Bold'
+            # Register Unicode fonts and get the font names to use
+            font_name, font_name_bold = self._register_unicode_fonts()
 
             # Create PDF in memory using canvas for precise positioning
-            pdf_buffer = BytesIO()
+            pdf_buffer = _PDFSink()
             c = canvas.Canvas(pdf_buffer, pagesize=(slide_width_pt, slide_height_pt))
 
-            for slide_idx, slide in enumerate(prs.slides):
-                self.log.debug(f"Processing slide {slide_idx + 1}")
+            # Classify every shape and read its geometry in one pass over the deck
+            slide_records = [
+                self._collect_shape_records(slide, slide_height_pt) for slide in prs.slides
+            ]
 
-                # Draw slide background (white by default)
-                c.setFillColor(colors.white)
-                c.rect(0, 0, slide_width_pt, slide_height_pt, fill=1, stroke=0)
-
-                # Try to get slide background color
-                try:
-                    if slide.background.fill.solid():
-                        bg_color = slide.background.fill.fore_color.rgb
-                        if bg_color:
-                            c.setFillColor(colors.HexColor(f'#{bg_color}'))
-                            c.rect(0, 0, slide_width_pt, slide_height_pt, fill=1, stroke=0)
-                except Exception:
-                    pass  # Use default white background
-
-                # Process shapes on the slide
-                for shape in slide.shapes:
-                    try:
-                        self._render_shape_to_canvas(
-                            c, shape, slide_width_emu, slide_height_emu,
-                            slide_width_pt, slide_height_pt,
-                            font_name, font_name_bold
-                        )
-                    except Exception as shape_error:
-                        self.log.debug(f"Error rendering shape: {shape_error}")
-                        continue
-
-                # Add slide number at bottom
-                c.setFont(font_name, 8)
-                c.setFillColor(colors.grey)
-                c.drawCentredString(slide_width_pt / 2, 15, f"Slide {slide_idx + 1}")
-
-                # Move to next page
-                c.showPage()
+            self._render_slides(
+                c, prs, slide_records, slide_width_pt, slide_height_pt,
+                font_name, font_name_bold
+            )
 
             # Save the PDF
             c.save()
             pdf_bytes = pdf_buffer.getvalue()
-            pdf_buffer.close()
 
             self.log.info(f"PPTX conversion complete: {len(prs.slides)} slides")
             return pdf_bytes
@@ -747,114 +889,275 @@ class DocumentConverterHandler(APIHandler):
         except Exception as e:
             raise Exception(f"PPTX to PDF conversion error: {str(e)}")
 
-    def _register_unicode_fonts(self):
-        """Register Unicode-supporting fonts from system paths."""
-        from reportlab.pdfbase.pdfmetrics import registerFontFamily
+    def _render_slides(self, c, prs, slide_records, slide_width_pt, slide_height_pt,
+                       font_name, font_name_bold):
+        """
+        Render every slide of the presentation as one canvas page.
+        The next slide's pictures are opened on the picture pool while the
+        current one is drawn, so at most two slides' images are held at once.
+        """
+        pictures, picture_hashes = self._submit_pictures(slide_records[0], {}) if slide_records else ({}, {})
+        upcoming = {}
+        try:
+            for slide_idx, (slide, records) in enumerate(zip(prs.slides, slide_records)):
+                if slide_idx + 1 < len(slide_records):
+                    upcoming, upcoming_hashes = self._submit_pictures(
+                        slide_records[slide_idx + 1], picture_hashes
+                    )
+                else:
+                    upcoming, upcoming_hashes = {}, {}
 
-        # Define font sets with normal, bold, italic, bolditalic variants
-        font_sets = [
-            # DejaVu fonts (most common, excellent Unicode support)
-            {
-                'normal': '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
-                'bold': '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
-                'italic': None,  # Not available in this set
-                'boldItalic': None,
-            },
-            # Liberation fonts (alternative)
-            {
-                'normal': '/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf',
-                'bold': '/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf',
-                'italic': '/usr/share/fonts/truetype/liberation/LiberationSans-Italic.ttf',
-                'boldItalic': '/usr/share/fonts/truetype/liberation/LiberationSans-BoldItalic.ttf',
-            },
-            # FreeSans (GNU FreeFont)
-            {
-                'normal': '/usr/share/fonts/truetype/freefont/FreeSans.ttf',
-                'bold': '/usr/share/fonts/truetype/freefont/FreeSansBold.ttf',
-                'italic': '/usr/share/fonts/truetype/freefont/FreeSansOblique.ttf',
-                'boldItalic': '/usr/share/fonts/truetype/freefont/FreeSansBoldOblique.ttf',
-            },
-        ]
+                self._render_slide(c, slide, slide_idx, records, slide_width_pt, slide_height_pt,
+                                   font_name, font_name_bold, pictures)
 
-        font_names = {
-            'normal': 'UnicodeSans',
-            'bold': 'UnicodeSansBold',
-            'italic': 'UnicodeSansItalic',
-            'boldItalic': 'UnicodeSansBoldItalic',
-        }
+                # Drop this slide's pictures, keeping only those the next slide shares
+                pictures, picture_hashes = upcoming, upcoming_hashes
+        finally:
+            # Drop pictures that never got drawn (e.g. rendering failed early)
+            for future in (*pictures.values(), *upcoming.values()):
+                future.cancel()
 
-        registered_fonts = set()
+    def _submit_pictures(self, records, reuse):
+        """
+        Start loading one slide's pictures on the shared picture pool.
+        reuse maps image SHA1 to the readers of the previous slide, so an image
+        repeated on consecutive slides (e.g. a logo) is loaded and decoded once.
+        Returns ({shape element: future}, {image SHA1: future}).
+        """
+        pictures = {}
+        hashes = {}
+        if not PIL_AVAILABLE:
+            return pictures, hashes
+        for kind, shape, *_ in records:
+            if kind != 'picture':
+                continue
+            try:
+                image = shape.image
+                sha1 = image.sha1
+                future = hashes.get(sha1) or reuse.get(sha1)
+                if future is None:
+                    future = _picture_executor.submit(self._load_picture, image.blob)
+                hashes[sha1] = future
+                pictures[shape._element] = future
+            except Exception:
+                pass  # Rendered as placeholder later
+        return pictures, hashes
 
-        # Try each font set until we find one with at least normal and bold
-        for font_set in font_sets:
-            if 'UnicodeSans' in registered_fonts:
-                break  # Already have fonts registered
+    def _render_slide(self, c, slide, slide_idx, records, slide_width_pt, slide_height_pt,
+                      font_name, font_name_bold, pictures):
+        """Draw one slide's background, shapes and number, then end the page."""
+        from reportlab.lib import colors
 
-            # Check if at least normal exists
-            if font_set['normal'] and os.path.exists(font_set['normal']):
-                for variant, path in font_set.items():
-                    if path and os.path.exists(path):
-                        font_name = font_names[variant]
-                        if font_name not in registered_fonts:
-                            try:
-                                pdfmetrics.registerFont(TTFont(font_name, path))
-                                registered_fonts.add(font_name)
-                                self.log.info(f"Registered font {font_name} from {path}")
-                            except Exception as font_error:
-                                self.log.debug(f"Failed to register {font_name} from {path}: {font_error}")
+        self.log.debug(f"Processing slide {slide_idx + 1}")
 
-        # Register font family to enable <b> and <i> tags in Paragraph
-        if 'UnicodeSans' in registered_fonts:
+        # Draw slide background (white by default)
+        c.setFillColor(colors.white)
+        c.rect(0, 0, slide_width_pt, slide_height_pt, fill=1, stroke=0)
+
+        # Try to get slide background color
+        try:
+            if slide.background.fill.solid():
+                bg_color = slide.background.fill.fore_color.rgb
+                if bg_color:
+                    c.setFillColor(_hex_color(f'#{bg_color}'))
+                    c.rect(0, 0, slide_width_pt, slide_height_pt, fill=1, stroke=0)
+        except Exception:
+            pass  # Use default white background
+
+        text_state = _SlideTextState()
+
+        # Draw the shapes collected for this slide
+        for kind, shape, x, y, width, height in records:
             try:
-                # Use Helvetica-Oblique as fallback for italic if no Unicode italic available
-                # (Helvetica is a built-in PDF font, always available)
-                italic_font = 'UnicodeSansItalic' if 'UnicodeSansItalic' in registered_fonts else 'Helvetica-Oblique'
-                bold_italic_font = 'UnicodeSansBoldItalic' if 'UnicodeSansBoldItalic' in registered_fonts else 'Helvetica-BoldOblique'
+                if kind == 'text':
+                    self._render_text_frame(c, shape.text_frame, x, y, width, height,
+                                            slide_height_pt, font_name, font_name_bold, text_state)
+                elif kind == 'picture':
+                    self._render_picture(c, shape, x, y, width, height,
+                                         pictures.get(shape._element), text_state)
+                else:
+                    self._render_table(c, shape.table, x, y, width, height,
+                                       font_name, font_name_bold, text_state)
+            except Exception as shape_error:
+                self.log.debug(f"Error rendering shape: {shape_error}")
+                continue
 
-                registerFontFamily(
-                    'UnicodeSans',
-                    normal='UnicodeSans',
-                    bold='UnicodeSansBold' if 'UnicodeSansBold' in registered_fonts else 'UnicodeSans',
-                    italic=italic_font,
-                    boldItalic=bold_italic_font
-                )
-                self.log.info(f"Registered UnicodeSans font family (italic={italic_font})")
-            except Exception as e:
-                self.log.debug(f"Failed to register font family: {e}")
+        # Add slide number at bottom
+        text_state.set_font(c, font_name, 8)
+        text_state.set_fill_color(c, colors.grey)
+        c.drawCentredString(slide_width_pt / 2, 15, f"Slide {slide_idx + 1}")
 
-        if not registered_fonts:
-            self.log.warning("No Unicode fonts found. International characters may not display correctly.")
-
-    def _render_shape_to_canvas(self, c, shape, slide_width_emu, slide_height_emu,
-                                 slide_width_pt, slide_height_pt, font_name, font_name_bold):
-        """Render a single shape to the PDF canvas."""
-        # Get shape position and size in points
-        # Note: PDF coordinates start from bottom-left, PPTX from top-left
-        left_pt = shape.left / 914400 * 72
-        top_pt = shape.top / 914400 * 72
-        width_pt = shape.width / 914400 * 72
-        height_pt = shape.height / 914400 * 72
-
-        # Convert to PDF coordinates (flip Y axis)
-        pdf_y = slide_height_pt - top_pt - height_pt
-
-        # Handle different shape types
-        if shape.has_text_frame:
-            self._render_text_frame(c, shape.text_frame, left_pt, pdf_y, width_pt, height_pt,
-                                    slide_height_pt, font_name, font_name_bold)
-
-        # Handle images
-        if shape.shape_type == MSO_SHAPE_TYPE.PICTURE:
-            self._render_picture(c, shape, left_pt, pdf_y, width_pt, height_pt)
-
-        # Handle tables
-        if shape.has_table:
-            self._render_table(c, shape.table, left_pt, pdf_y, width_pt, height_pt,
-                              font_name, font_name_bold)
+        # Move to next page
+        c.showPage()
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _get_styles(font_name: str, font_name_bold: str) -> dict:
+        """
+        Build the DOCX paragraph and table styles for a font pair.
+        Cached so repeated conversions reuse the same style objects.
+        """
+        from reportlab.lib import colors
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.platypus import TableStyle
+
+        sample_styles = _sample_style_sheet()
+
+        # Create custom styles matching document structure
+        normal_style = ParagraphStyle(
+            'CustomNormal',
+            parent=sample_styles['Normal'],
+            fontName=font_name,
+            fontSize=10,
+            leading=12,
+            spaceAfter=6
+        )
+
+        # List styles with proper indentation
+        list_bullet_style = ParagraphStyle(
+            'CustomListBullet',
+            parent=sample_styles['Normal'],
+            fontName=font_name,
+            fontSize=10,
+            leading=12,
+            spaceAfter=3,
+            leftIndent=18,
+            bulletIndent=6
+        )
+
+        list_bullet_2_style = ParagraphStyle(
+            'CustomListBullet2',
+            parent=sample_styles['Normal'],
+            fontName=font_name,
+            fontSize=10,
+            leading=12,
+            spaceAfter=3,
+            leftIndent=36,
+            bulletIndent=24
+        )
+
+        # Numbered lists share the bullet list metrics
+        list_number_style = ParagraphStyle('CustomListNumber', parent=list_bullet_style)
+        list_number_2_style = ParagraphStyle('CustomListNumber2', parent=list_bullet_2_style)
+
+        heading1_style = ParagraphStyle(
+            'CustomHeading1',
+            parent=sample_styles['Heading1'],
+            fontName=font_name_bold,
+            fontSize=14,
+            leading=18,
+            spaceAfter=6,
+            spaceBefore=10,
+            textColor=colors.HexColor('#365F91')
+        )
+
+        heading2_style = ParagraphStyle(
+            'CustomHeading2',
+            parent=sample_styles['Heading2'],
+            fontName=font_name_bold,
+            fontSize=12,
+            leading=15,
+            spaceAfter=4,
+            spaceBefore=8,
+            textColor=colors.HexColor('#4F81BD')
+        )
+
+        heading3_style = ParagraphStyle(
+            'CustomHeading3',
+            parent=sample_styles['Heading3'],
+            fontName=font_name_bold,
+            fontSize=11,
+            leading=14,
+            spaceAfter=3,
+            spaceBefore=6,
+            textColor=colors.HexColor('#4F81BD')
+        )
+
+        # Code/monospace style for inline code and filenames
+        font_name_mono = 'Courier'
+        code_style = ParagraphStyle(
+            'CustomCode',
+            parent=sample_styles['Normal'],
+            fontName=font_name_mono,
+            fontSize=9,
+            leading=11,
+            spaceAfter=4,
+            backColor=colors.HexColor('#f5f5f5'),
+            leftIndent=6,
+            rightIndent=6
+        )
+
+        # Table style shared by all tables (setStyle only reads its commands)
+        table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#dbe5f1')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#365F91')),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), font_name_bold),
+            ('FONTNAME', (0, 1), (-1, -1), font_name),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 4),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#cccccc'))
+        ])
+
+        return {
+            'normal': normal_style,
+            'list_bullet': list_bullet_style,
+            'list_bullet_2': list_bullet_2_style,
+            'list_number': list_number_style,
+            'list_number_2': list_number_2_style,
+            'heading1': heading1_style,
+            'heading2': heading2_style,
+            'heading3': heading3_style,
+            'code': code_style,
+            'table': table_style,
+        }
+
+    def _register_unicode_fonts(self):
+        """
+        Register Unicode-supporting fonts from system paths (once per process).
+        Returns the (regular, bold) font names to use.
+        """
+        return _register_unicode_fonts_once(self.log)
+
+    def _collect_shape_records(self, slide, slide_height_pt):
+        """
+        Classify each drawable shape on a slide and read its geometry once.
+        Returns (kind, shape, x, y, width, height) tuples with kind one of
+        'text', 'picture' or 'table' and the position in PDF points.
+        """
+        from pptx.shapes.picture import Picture as PptxPicture
+
+        records = []
+        for shape in slide.shapes:
+            try:
+                # shape_type is costly on autoshapes, so pictures are matched by
+                # class (placeholder pictures report PLACEHOLDER and are skipped)
+                if shape.has_text_frame:
+                    kind = 'text'
+                elif type(shape) is PptxPicture:
+                    kind = 'picture'
+                elif shape.has_table:
+                    kind = 'table'
+                else:
+                    continue
+
+                # Get shape position and size in points
+                # Note: PDF coordinates start from bottom-left, PPTX from top-left
+                width_pt = shape.width / EMU_PER_POINT
+                height_pt = shape.height / EMU_PER_POINT
+                pdf_y = slide_height_pt - shape.top / EMU_PER_POINT - height_pt
+                records.append((kind, shape, shape.left / EMU_PER_POINT, pdf_y, width_pt, height_pt))
+            except Exception as shape_error:
+                self.log.debug(f"Error reading shape: {shape_error}")
+        return records
 
     def _render_text_frame(self, c, text_frame, x, y, width, height, slide_height_pt,
-                           font_name, font_name_bold):
+                           font_name, font_name_bold, text_state):
         """Render a text frame to the canvas."""
+        from pptx.enum.text import PP_ALIGN
+        from reportlab.lib import colors
+
         current_y = y + height - 5  # Start from top of text box
 
         for paragraph in text_frame.paragraphs:
@@ -863,132 +1166,374 @@ class DocumentConverterHandler(APIHandler):
                 current_y -= 12  # Empty paragraph spacing
                 continue
 
-            # Determine font size and style
+            # First run's formatting applies to the whole line (runs is rebuilt on each access)
+            runs = paragraph.runs
+
+            # Determine font size, style and color
             font_size = 12  # Default
             current_font = font_name
+            fill_color = colors.black
 
-            try:
-                if paragraph.runs:
-                    run = paragraph.runs[0]
-                    if run.font.size:
-                        font_size = run.font.size.pt
-                    if run.font.bold:
+            if runs:
+                font = runs[0].font
+                try:
+                    size = font.size
+                    if size:
+                        font_size = size.pt
+                    if font.bold:
                         current_font = font_name_bold
-            except Exception:
-                pass
+                except Exception:
+                    pass  # Keep the default size and weight
+
+                # Scheme, unset and unreadable colors fall back to black
+                try:
+                    rgb = getattr(font.color, 'rgb', None)
+                    if rgb:
+                        fill_color = _hex_color(f'#{rgb}')
+                except Exception:
+                    fill_color = colors.black
 
             # Clamp font size to reasonable range
             font_size = max(6, min(72, font_size))
 
-            # Set font color
-            try:
-                if paragraph.runs and paragraph.runs[0].font.color.rgb:
-                    rgb = paragraph.runs[0].font.color.rgb
-                    c.setFillColor(colors.HexColor(f'#{rgb}'))
-                else:
-                    c.setFillColor(colors.black)
-            except Exception:
-                c.setFillColor(colors.black)
+            text_state.set_fill_color(c, fill_color)
+            text_state.set_font(c, current_font, font_size)
 
-            c.setFont(current_font, font_size)
-
-            # Handle text alignment
+            # Handle text alignment, drawing left-aligned when it cannot be read
             try:
-                from pptx.enum.text import PP_ALIGN
-                if paragraph.alignment == PP_ALIGN.CENTER:
-                    c.drawCentredString(x + width / 2, current_y, text)
-                elif paragraph.alignment == PP_ALIGN.RIGHT:
-                    c.drawRightString(x + width, current_y, text)
-                else:
-                    c.drawString(x + 5, current_y, text)
+                alignment = paragraph.alignment
             except Exception:
+                alignment = None
+            if alignment == PP_ALIGN.CENTER:
+                c.drawCentredString(x + width / 2, current_y, text)
+            elif alignment == PP_ALIGN.RIGHT:
+                c.drawRightString(x + width, current_y, text)
+            else:
                 c.drawString(x + 5, current_y, text)
 
             # Move to next line
             current_y -= font_size * 1.2
 
-    def _render_picture(self, c, shape, x, y, width, height):
-        """Render a picture shape to the canvas."""
+    def _load_picture(self, image_bytes):
+        """
+        Wrap a picture blob in a reportlab ImageReader (thread-safe).
+        The reader holds the original encoded data: JPEG is embedded as-is and
+        other formats are decoded once, when drawn, keeping any alpha channel.
+        """
+        from reportlab.lib.utils import ImageReader
+
+        return ImageReader(BytesIO(image_bytes))
+
+    def _render_picture(self, c, shape, x, y, width, height, picture, text_state):
+        """
+        Render a picture shape to the canvas.
+        picture is an optional future resolving to the picture's ImageReader.
+        """
         if not PIL_AVAILABLE:
             self.log.debug("PIL not available, skipping image")
             return
 
-        try:
-            # Get image blob from shape
-            image = shape.image
-            image_bytes = image.blob
-
-            # Create PIL image and save to buffer
-            pil_image = PILImage.open(BytesIO(image_bytes))
-
-            # Convert to RGB if necessary (for PDF compatibility)
-            if pil_image.mode in ('RGBA', 'P'):
-                pil_image = pil_image.convert('RGB')
+        from reportlab.lib import colors
 
-            # Save to buffer for reportlab
-            img_buffer = BytesIO()
-            pil_image.save(img_buffer, format='PNG')
-            img_buffer.seek(0)
+        try:
+            if picture is not None:
+                img_reader = picture.result()
+            else:
+                img_reader = self._load_picture(shape.image.blob)
 
             # Draw image on canvas using ImageReader
-            from reportlab.lib.utils import ImageReader
-            img_reader = ImageReader(img_buffer)
             c.drawImage(img_reader, x, y, width=width, height=height,
                         preserveAspectRatio=True, mask='auto')
         except Exception as e:
             self.log.debug(f"Error rendering image: {e}")
             # Draw placeholder rectangle
             c.setStrokeColor(colors.grey)
-            c.setFillColor(colors.lightgrey)
+            text_state.set_fill_color(c, colors.lightgrey)
             c.rect(x, y, width, height, fill=1, stroke=1)
-            c.setFillColor(colors.grey)
-            c.setFont('Helvetica', 8)
+            text_state.set_fill_color(c, colors.grey)
+            text_state.set_font(c, 'Helvetica', 8)
             c.drawCentredString(x + width/2, y + height/2, "[Image]")
 
-    def _render_table(self, c, table, x, y, width, height, font_name, font_name_bold):
+    def _render_table(self, c, table, x, y, width, height, font_name, font_name_bold, text_state):
         """Render a table to the canvas."""
-        if not table.rows:
+        from reportlab.lib import colors
+
+        # Read every cell's text once before drawing
+        rows = [[cell.text.strip() for cell in row.cells] for row in table.rows]
+        if not rows:
             return
 
-        num_rows = len(table.rows)
+        num_rows = len(rows)
         num_cols = len(table.columns)
 
         cell_width = width / num_cols
         cell_height = height / num_rows
 
+        # Width available to text, which is inset 3pt from the cell border
+        text_width = cell_width - 6
+
         current_y = y + height  # Start from top
 
-        for row_idx, row in enumerate(table.rows):
+        c.setStrokeColor(colors.black)
+        for row_idx, row in enumerate(rows):
             current_x = x
             current_y -= cell_height
 
-            for col_idx, cell in enumerate(row.cells):
+            # Use bold for header row
+            row_font = font_name_bold if row_idx == 0 else font_name
+            text_state.set_font(c, row_font, 9)
+            text_state.set_fill_color(c, _hex_color('#333333') if row_idx == 0 else colors.black)
+
+            for text in row:
                 # Draw cell border
-                c.setStrokeColor(colors.black)
                 c.rect(current_x, current_y, cell_width, cell_height, fill=0, stroke=1)
 
                 # Draw cell text
-                text = cell.text.strip()
                 if text:
-                    # Use bold for header row
-                    if row_idx == 0:
-                        c.setFont(font_name_bold, 9)
-                        c.setFillColor(colors.HexColor('#333333'))
-                    else:
-                        c.setFont(font_name, 9)
-                        c.setFillColor(colors.black)
-
-                    # Truncate text if too long
-                    max_chars = int(cell_width / 5)
-                    if len(text) > max_chars:
-                        text = text[:max_chars-2] + '..'
+                    # Truncate text if too wide for the cell
+                    text = _fit_text(text, row_font, 9, text_width)
 
                     c.drawString(current_x + 3, current_y + cell_height/2 - 3, text)
 
                 current_x += cell_width
 
 
-def setup_handlers(web_app):
+@lru_cache(maxsize=4)
+def _empty_document_pdf(font_name: str, font_name_bold: str) -> bytes:
+    """Placeholder PDF for DOCX files without readable content, built once per font pair."""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph
+
+    styles = DocumentConverterHandler._get_styles(font_name, font_name_bold)
+    pdf_buffer = _PDFSink()
+    SimpleDocTemplate(
+        pdf_buffer,
+        pagesize=letter,
+        rightMargin=36,
+        leftMargin=36,
+        topMargin=36,
+        bottomMargin=36
+    ).build([Paragraph("Document appears to be empty or contains no readable content.", styles['normal'])])
+    return pdf_buffer.getvalue()
+
+
+class _SlideTextState:
+    """
+    Font and fill colour last set on the canvas while drawing one slide, so
+    lines sharing them emit no repeated Tf/rg operators. Create one per page:
+    showPage resets the canvas graphics state.
+    """
+
+    __slots__ = ('font', 'fill_color')
+
+    def __init__(self):
+        self.font = None
+        self.fill_color = None
+
+    def set_font(self, c, font_name: str, font_size: float):
+        font = (font_name, font_size)
+        if font != self.font:
+            c.setFont(font_name, font_size)
+            self.font = font
+
+    def set_fill_color(self, c, color):
+        # Colours come from _hex_color or reportlab's named colours, so identity means equality
+        if color is not self.fill_color:
+            c.setFillColor(color)
+            self.fill_color = color
+
+
+@lru_cache(maxsize=None)
+def _sample_style_sheet():
+    """reportlab's sample stylesheet, built once and used as the parent of all custom styles."""
+    from reportlab.lib.styles import getSampleStyleSheet
+    return getSampleStyleSheet()
+
+
+def _register_unicode_fonts_once(log):
+    """
+    Register Unicode-supporting fonts from system paths.
+    reportlab's font registry is process-global, so this runs once per process;
+    later calls (from any conversion path or the startup preload) return the
+    resolved (regular, bold) font names immediately, falling back to Helvetica.
+    """
+    global _font_pair
+    if _font_pair is not None:
+        return _font_pair
+
+    with _fonts_lock:
+        if _font_pair is not None:
+            return _font_pair
+
+        if not _load_reportlab():
+            return ('Helvetica', 'Helvetica-Bold')
+
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.pdfmetrics import registerFontFamily
+        from reportlab.pdfbase.ttfonts import TTFont
+
+        # Define font sets with normal, bold, italic, bolditalic variants
+        font_sets = [
+            # DejaVu fonts (most common, excellent Unicode support)
+            {
+                'normal': '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+                'bold': '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
+                'italic': None,  # Not available in this set
+                'boldItalic': None,
+            },
+            # Liberation fonts (alternative)
+            {
+                'normal': '/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf',
+                'bold': '/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf',
+                'italic': '/usr/share/fonts/truetype/liberation/LiberationSans-Italic.ttf',
+                'boldItalic': '/usr/share/fonts/truetype/liberation/LiberationSans-BoldItalic.ttf',
+            },
+            # FreeSans (GNU FreeFont)
+            {
+                'normal': '/usr/share/fonts/truetype/freefont/FreeSans.ttf',
+                'bold': '/usr/share/fonts/truetype/freefont/FreeSansBold.ttf',
+                'italic': '/usr/share/fonts/truetype/freefont/FreeSansOblique.ttf',
+                'boldItalic': '/usr/share/fonts/truetype/freefont/FreeSansBoldOblique.ttf',
+            },
+        ]
+
+        font_names = {
+            'normal': 'UnicodeSans',
+            'bold': 'UnicodeSansBold',
+            'italic': 'UnicodeSansItalic',
+            'boldItalic': 'UnicodeSansBoldItalic',
+        }
+
+        registered_fonts = set()
+
+        # Fonts installed outside the Debian layout above are located by file
+        # name, scanning the font directories once and only if a path is missing
+        found_fonts = None
+
+        def resolve_font(path):
+            nonlocal found_fonts
+            if path is None or os.path.exists(path):
+                return path
+            if found_fonts is None:
+                found_fonts = _scan_font_dirs(
+                    {os.path.basename(p) for fs in font_sets for p in fs.values() if p}
+                )
+                log.debug(f"Font directory scan found: {sorted(found_fonts)}")
+            return found_fonts.get(os.path.basename(path))
+
+        # Try each font set until we find one with at least normal and bold
+        for font_set in font_sets:
+            if 'UnicodeSans' in registered_fonts:
+                break  # Already have fonts registered
+
+            # Check if at least normal exists
+            if resolve_font(font_set['normal']):
+                for variant, path in font_set.items():
+                    path = resolve_font(path)
+                    if path:
+                        font_name = font_names[variant]
+                        if font_name not in registered_fonts:
+                            try:
+                                pdfmetrics.registerFont(TTFont(font_name, path))
+                                registered_fonts.add(font_name)
+                                log.info(f"Registered font {font_name} from {path}")
+                            except Exception as font_error:
+                                log.debug(f"Failed to register {font_name} from {path}: {font_error}")
+
+        # Register font family to enable <b> and <i> tags in Paragraph
+        if 'UnicodeSans' in registered_fonts:
+            try:
+                # Use Helvetica-Oblique as fallback for italic if no Unicode italic available
+                # (Helvetica is a built-in PDF font, always available)
+                italic_font = 'UnicodeSansItalic' if 'UnicodeSansItalic' in registered_fonts else 'Helvetica-Oblique'
+                bold_italic_font = 'UnicodeSansBoldItalic' if 'UnicodeSansBoldItalic' in registered_fonts else 'Helvetica-BoldOblique'
+
+                registerFontFamily(
+                    'UnicodeSans',
+                    normal='UnicodeSans',
+                    bold='UnicodeSansBold' if 'UnicodeSansBold' in registered_fonts else 'UnicodeSans',
+                    italic=italic_font,
+                    boldItalic=bold_italic_font
+                )
+                log.info(f"Registered UnicodeSans font family (italic={italic_font})")
+            except Exception as e:
+                log.debug(f"Failed to register font family: {e}")
+
+        if not registered_fonts:
+            log.warning("No Unicode fonts found. International characters may not display correctly.")
+
+        _font_pair = (
+            'UnicodeSans' if 'UnicodeSans' in registered_fonts else 'Helvetica',
+            'UnicodeSansBold' if 'UnicodeSansBold' in registered_fonts else 'Helvetica-Bold',
+        )
+        return _font_pair
+
+
+def _scan_font_dirs(file_names) -> dict:
+    """Walk the system font directories once, mapping each wanted file name to its path."""
+    found = {}
+    for font_dir in _FONT_DIRS:
+        for dir_path, _, files in os.walk(font_dir):
+            for file_name in files:
+                if file_name in file_names and file_name not in found:
+                    found[file_name] = os.path.join(dir_path, file_name)
+    return found
+
+
+def _warm_up(log):
+    """
+    Import the conversion libraries, register the Unicode fonts, build the
+    paragraph styles and lay out a tiny document so reportlab's parser, font
+    subsetting and PDF writer are initialised.
+    """
+    try:
+        if not _load_reportlab():
+            return
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import SimpleDocTemplate, Paragraph
+
+        _load_docx()
+        _load_pptx()
+        _load_pil()
+
+        font_name, font_name_bold = _register_unicode_fonts_once(log)
+        styles = DocumentConverterHandler._get_styles(font_name, font_name_bold)
+        SimpleDocTemplate(_PDFSink(), pagesize=letter).build([
+            Paragraph('<b>Warm</b> up', styles['heading1']),
+            Paragraph('Warm up', styles['normal']),
+        ])
+    except Exception as e:
+        log.debug(f"Converter warm-up failed: {e}")
+
+
+def _fit_text(text: str, font_name: str, font_size: float, max_width: float) -> str:
+    """
+    Return text, or its longest prefix followed by '..', that fits max_width
+    points when drawn in the given font (binary search on measured widths).
+    """
+    from reportlab.pdfbase.pdfmetrics import stringWidth as string_width
+
+    if string_width(text, font_name, font_size) <= max_width:
+        return text
+
+    lo, hi = 0, len(text) - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if string_width(text[:mid] + '..', font_name, font_size) <= max_width:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo] + '..'
+
+
+def _iter_chunks(data: bytes, chunk_size: int):
+    """Yield zero-copy memoryview slices of data, chunk_size bytes each."""
+    view = memoryview(data)
+    for start in range(0, len(view), chunk_size):
+        yield view[start:start + chunk_size]
+
+
+def setup_handlers(web_app, log=None):
     host_pattern = ".*$"
 
     base_url = web_app.settings["base_url"]
@@ -998,3 +1543,12 @@ def setup_handlers(web_app):
     handlers = [(converter_pattern, DocumentConverterHandler)]
 
     web_app.add_handlers(host_pattern, handlers)
+
+    # Warm up in the background so neither server startup nor the first conversion
+    # pays for importing the libraries, TTF parsing and reportlab's lazy initialisation
+    threading.Thread(
+        target=_warm_up,
+        args=(log or app_log,),
+        name="doc-reader-warm-up",
+        daemon=True
+    ).start()
@@ -1,2 +1,3 @@
 # Override root conftest.py for standalone tests
-# No pytest_jupyter dependency needed for unit tests
+# No pytest_jupyter dependency needed for unit tests; the endpoint tests load it
+# with -p pytest_jupyter.jupyter_server and skip without it
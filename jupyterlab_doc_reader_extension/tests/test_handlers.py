@@ -1,21 +1,23 @@
 """Tests for document conversion handlers."""
 
-import os
-import tempfile
+import base64
+import copy
+import functools
+import logging
 import pytest
+import re
+import zlib
 from io import BytesIO
-from unittest.mock import MagicMock, patch, PropertyMock
-
-# Import conversion libraries
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from docx import Document
-from reportlab.pdfgen import canvas
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.lib import colors
+from unittest.mock import Mock, patch
+
 from pypdf import PdfReader
 
+from jupyterlab_doc_reader_extension import handlers
+from jupyterlab_doc_reader_extension.handlers import DocumentConverterHandler
+
+# python-pptx, python-docx and reportlab are imported inside the tests that
+# use them, so collecting this module does not load them
+
 
 def extract_pdf_text(pdf_bytes):
     """Extract text from PDF bytes using pypdf."""
@@ -26,22 +28,94 @@ def extract_pdf_text(pdf_bytes):
     return text
 
 
-def create_mock_handler():
-    """Create a handler instance with mocked log property."""
-    from jupyterlab_doc_reader_extension.handlers import DocumentConverterHandler
-    handler = object.__new__(DocumentConverterHandler)
-    # Set the _log attribute directly to bypass property
-    object.__setattr__(handler, '_log', MagicMock())
-    return handler
+_PAGE_CONTENTS = re.compile(rb'/Contents (\d+) 0 R')
+
+
+@functools.lru_cache(maxsize=32)
+def pdf_page_contents(pdf_bytes):
+    """
+    Return the decompressed content streams of every page, concatenated.
+
+    ReportLab keeps ASCII characters at their own codes in the first subset
+    of an embedded TrueType font, so ASCII text appears literally in the
+    content streams (with parentheses and backslashes escaped). Font files
+    and CMaps are skipped, since their names would give false matches. A
+    paragraph with markup may be drawn as several strings; use
+    extract_pdf_text when the needle spans such fragments.
+    """
+    contents = []
+    for number in _PAGE_CONTENTS.findall(pdf_bytes):
+        start = pdf_bytes.index(b'\n%s 0 obj' % number)
+        begin = pdf_bytes.index(b'stream\n', start) + len(b'stream\n')
+        data = pdf_bytes[begin:pdf_bytes.index(b'endstream', begin)]
+        header = pdf_bytes[start:begin]
+        if b'/ASCII85Decode' in header:
+            data = base64.a85decode(data.rstrip(), adobe=True)
+        if b'/FlateDecode' in header:
+            data = zlib.decompressobj().decompress(data)
+        contents.append(data)
+    return b'\n'.join(contents)
+
+
+def pdf_contains(pdf_bytes, needle):
+    """Check whether an ASCII needle is drawn on any page, without a full text extraction."""
+    return needle in pdf_page_contents(pdf_bytes)
+
+
+@functools.lru_cache(maxsize=1)
+def _blank_document():
+    from docx import Document
+    return Document()
+
+
+@functools.lru_cache(maxsize=1)
+def _blank_presentation():
+    from pptx import Presentation
+    return Presentation()
+
 
+def new_document():
+    """Return an empty python-docx Document, copied instead of reparsing the default template."""
+    return copy.deepcopy(_blank_document())
 
+
+def new_presentation():
+    """Return an empty python-pptx Presentation, copied instead of reparsing the default template."""
+    return copy.deepcopy(_blank_presentation())
+
+
+class StubConverter(DocumentConverterHandler):
+    """The converter handler without a tornado application, request or log property."""
+
+    log = logging.getLogger(__name__)
+
+    def __init__(self):
+        pass
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _unicode_fonts():
+    """Register the Unicode fonts once, before the first test that converts a document."""
+    return handlers._register_unicode_fonts_once(Mock(spec=logging.Logger))
+
+
+@pytest.fixture(scope="module")
+def handler():
+    """
+    A stub converter handler. Conversions keep no state on the handler, so one
+    instance is shared by the module's tests.
+    """
+    return StubConverter()
+
+
+@pytest.mark.xdist_group(name="conv")
 class TestPPTXConversion:
     """Test PPTX to PDF conversion functionality."""
 
-    @pytest.fixture
-    def sample_pptx(self):
+    @pytest.fixture(scope="module")
+    def sample_pptx(self, tmp_path_factory):
         """Create a sample PPTX file for testing."""
-        prs = Presentation()
+        prs = new_presentation()
 
         # Add title slide
         title_slide_layout = prs.slide_layouts[0]
@@ -67,143 +141,156 @@ class TestPPTXConversion:
         p.text = "Polish characters: ąćęłńóśźż"
         p.level = 0
 
-        # Save to temp file
-        with tempfile.NamedTemporaryFile(suffix='.pptx', delete=False) as f:
-            prs.save(f.name)
-            yield f.name
-
-        # Cleanup
-        os.unlink(f.name)
+        # Saved once into pytest's session temp directory, which pytest cleans up
+        path = tmp_path_factory.mktemp('sample') / 'sample.pptx'
+        prs.save(str(path))
+        return str(path)
 
-    def test_pptx_loads_correctly(self, sample_pptx):
-        """Test that sample PPTX file loads correctly."""
-        prs = Presentation(sample_pptx)
-        assert len(prs.slides) == 2
-
-    def test_pptx_has_slide_dimensions(self, sample_pptx):
-        """Test that PPTX has valid slide dimensions."""
-        prs = Presentation(sample_pptx)
-        assert prs.slide_width > 0
-        assert prs.slide_height > 0
-
-    def test_pptx_conversion_produces_pdf(self, sample_pptx):
-        """Test that PPTX conversion produces valid PDF bytes."""
-        from jupyterlab_doc_reader_extension.handlers import DocumentConverterHandler
-
-        with patch.object(DocumentConverterHandler, 'log', new_callable=PropertyMock) as mock_log:
-            mock_log.return_value = MagicMock()
-            handler = object.__new__(DocumentConverterHandler)
-            pdf_bytes = handler._convert_pptx_to_pdf(sample_pptx)
+    def test_pptx_conversion_produces_pdf(self, handler, sample_pptx):
+        """Test that PPTX conversion produces a valid PDF with one page per slide."""
+        pdf_bytes = handler._convert_pptx_to_pdf(sample_pptx)
 
         # Check that we got PDF bytes
         assert pdf_bytes is not None
         assert len(pdf_bytes) > 0
         # PDF files start with %PDF
-        assert pdf_bytes[:4] == b'%PDF'
+        assert pdf_bytes.startswith(b'%PDF')
+        # PDF should contain one page per slide
+        assert len(PdfReader(BytesIO(pdf_bytes)).pages) == 2
+
+    def test_pptx_formatted_text_renders(self, handler, tmp_path):
+        """Test that colored, bold, themed and aligned paragraphs are all drawn."""
+        from pptx.util import Inches
+        from pptx.dml.color import RGBColor
+        from pptx.enum.dml import MSO_THEME_COLOR
+        from pptx.enum.text import PP_ALIGN
+
+        prs = new_presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        tf = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(6), Inches(3)).text_frame
+        tf.text = 'Red centered'
+        run = tf.paragraphs[0].runs[0]
+        run.font.color.rgb = RGBColor(0xCC, 0x00, 0x00)
+        run.font.bold = True
+        tf.paragraphs[0].alignment = PP_ALIGN.CENTER
+        p = tf.add_paragraph()
+        p.text = 'Themed right'
+        p.runs[0].font.color.theme_color = MSO_THEME_COLOR.ACCENT_1
+        p.alignment = PP_ALIGN.RIGHT
 
-    def test_pptx_conversion_multiple_slides(self, sample_pptx):
-        """Test that conversion handles multiple slides."""
-        from jupyterlab_doc_reader_extension.handlers import DocumentConverterHandler
+        path = str(tmp_path / 'document.pptx')
+        prs.save(path)
 
-        with patch.object(DocumentConverterHandler, 'log', new_callable=PropertyMock) as mock_log:
-            mock_log.return_value = MagicMock()
-            handler = object.__new__(DocumentConverterHandler)
-            pdf_bytes = handler._convert_pptx_to_pdf(sample_pptx)
+        pdf_bytes = handler._convert_pptx_to_pdf(path)
 
-        # PDF should contain multiple pages
-        assert pdf_bytes is not None
-        # Check PDF contains page references
-        assert b'/Page' in pdf_bytes
+        assert pdf_contains(pdf_bytes, b'Red centered')
+        assert pdf_contains(pdf_bytes, b'Themed right')
+
+    def test_pptx_unreadable_color_and_alignment_fall_back(self, handler, tmp_path):
+        """Test that a paragraph with an invalid colour and alignment is still drawn."""
+        from pptx.util import Inches
+        from pptx.dml.color import RGBColor
+
+        prs = new_presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        tf = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(6), Inches(2)).text_frame
+        tf.text = 'Damaged paragraph'
+        paragraph = tf.paragraphs[0]
+        paragraph.runs[0].font.color.rgb = RGBColor(0xCC, 0x00, 0x00)
+        # Values python-pptx cannot parse, as written by some third-party tools
+        paragraph.runs[0]._r.xpath('.//a:srgbClr')[0].set('val', 'ZZZZZZ')
+        paragraph._p.get_or_add_pPr().set('algn', 'bogus')
+
+        path = str(tmp_path / 'document.pptx')
+        prs.save(path)
+
+        pdf_bytes = handler._convert_pptx_to_pdf(path)
+
+        assert pdf_contains(pdf_bytes, b'Damaged paragraph')
+
+    def test_pptx_unchanged_font_and_color_set_once(self, handler, tmp_path):
+        """Test that lines sharing a colour emit no repeated rg operators."""
+        from pptx.util import Inches
+
+        prs = new_presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        tf = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(6), Inches(4)).text_frame
+        tf.text = 'Line 0'
+        for i in range(1, 6):
+            tf.add_paragraph().text = f'Line {i}'
+
+        path = str(tmp_path / 'document.pptx')
+        prs.save(path)
 
+        pdf_bytes = handler._convert_pptx_to_pdf(path)
 
+        content = pdf_page_contents(pdf_bytes)
+        assert all(b'Line %d' % i in content for i in range(6))
+        # Background, the text lines and the slide number: one rg each
+        assert content.count(b' rg\n') == 3
+
+
+@pytest.mark.xdist_group(name="conv")
 class TestDOCXConversion:
     """Test DOCX to PDF conversion functionality."""
 
-    @pytest.fixture
-    def sample_docx(self):
+    @pytest.fixture(scope="module")
+    def sample_docx(self, tmp_path_factory):
         """Create a sample DOCX file for testing."""
-        doc = Document()
+        doc = new_document()
         doc.add_heading('Test Document', 0)
         doc.add_paragraph('This is a test paragraph.')
         doc.add_paragraph('Polish characters: ąćęłńóśźż')
         doc.add_heading('Section 1', level=1)
         doc.add_paragraph('More content here.')
 
-        # Save to temp file
-        with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as f:
-            doc.save(f.name)
-            yield f.name
+        # Saved once into pytest's session temp directory, which pytest cleans up
+        path = tmp_path_factory.mktemp('sample') / 'sample.docx'
+        doc.save(str(path))
+        return str(path)
 
-        # Cleanup
-        os.unlink(f.name)
-
-    def test_docx_loads_correctly(self, sample_docx):
-        """Test that sample DOCX file loads correctly."""
-        doc = Document(sample_docx)
-        assert len(doc.paragraphs) > 0
-
-    def test_docx_conversion_produces_pdf(self, sample_docx):
+    def test_docx_conversion_produces_pdf(self, handler, sample_docx):
         """Test that DOCX conversion produces valid PDF bytes."""
-        from jupyterlab_doc_reader_extension.handlers import DocumentConverterHandler
-
-        with patch.object(DocumentConverterHandler, 'log', new_callable=PropertyMock) as mock_log:
-            mock_log.return_value = MagicMock()
-            handler = object.__new__(DocumentConverterHandler)
-            pdf_bytes = handler._convert_docx_to_pdf(sample_docx)
+        pdf_bytes = handler._convert_docx_to_pdf(sample_docx)
 
         # Check that we got PDF bytes
         assert pdf_bytes is not None
         assert len(pdf_bytes) > 0
         # PDF files start with %PDF
-        assert pdf_bytes[:4] == b'%PDF'
+        assert pdf_bytes.startswith(b'%PDF')
+
+    def test_empty_docx_returns_cached_placeholder(self, handler, tmp_path):
+        """Test that a DOCX without paragraphs or tables gets the prebuilt placeholder PDF."""
+        doc = new_document()
+        body = doc.element.body
+        for child in list(body.iterchildren()):
+            if not child.tag.endswith('}sectPr'):
+                body.remove(child)
+
+        path = str(tmp_path / 'document.docx')
+        doc.save(path)
+
+        first = handler._convert_docx_to_pdf(path)
+        second = handler._convert_docx_to_pdf(path)
+
+        assert first is second
+        assert pdf_contains(first, b'Document appears to be empty')
 
 
 class TestFileTypeRouting:
     """Test file type detection and routing."""
 
-    def test_unsupported_ppt_format(self):
-        """Test that legacy PPT format raises appropriate error."""
-        from jupyterlab_doc_reader_extension.handlers import DocumentConverterHandler
-
-        with patch.object(DocumentConverterHandler, 'log', new_callable=PropertyMock) as mock_log:
-            mock_log.return_value = MagicMock()
-            handler = object.__new__(DocumentConverterHandler)
-            with pytest.raises(Exception) as exc_info:
-                handler._convert_to_pdf('/path/to/file.ppt')
-            assert 'PPT format not supported' in str(exc_info.value)
-
-    def test_unsupported_doc_format(self):
-        """Test that legacy DOC format raises appropriate error."""
-        from jupyterlab_doc_reader_extension.handlers import DocumentConverterHandler
-
-        with patch.object(DocumentConverterHandler, 'log', new_callable=PropertyMock) as mock_log:
-            mock_log.return_value = MagicMock()
-            handler = object.__new__(DocumentConverterHandler)
-            with pytest.raises(Exception) as exc_info:
-                handler._convert_to_pdf('/path/to/file.doc')
-            assert 'DOC' in str(exc_info.value) or 'not supported' in str(exc_info.value)
-
-    def test_unsupported_rtf_format(self):
-        """Test that RTF format raises appropriate error."""
-        from jupyterlab_doc_reader_extension.handlers import DocumentConverterHandler
-
-        with patch.object(DocumentConverterHandler, 'log', new_callable=PropertyMock) as mock_log:
-            mock_log.return_value = MagicMock()
-            handler = object.__new__(DocumentConverterHandler)
-            with pytest.raises(Exception) as exc_info:
-                handler._convert_to_pdf('/path/to/file.rtf')
-            assert 'RTF' in str(exc_info.value) or 'not supported' in str(exc_info.value)
-
-    def test_unknown_file_type(self):
-        """Test that unknown file types raise appropriate error."""
-        from jupyterlab_doc_reader_extension.handlers import DocumentConverterHandler
-
-        with patch.object(DocumentConverterHandler, 'log', new_callable=PropertyMock) as mock_log:
-            mock_log.return_value = MagicMock()
-            handler = object.__new__(DocumentConverterHandler)
-            with pytest.raises(Exception) as exc_info:
-                handler._convert_to_pdf('/path/to/file.xyz')
-            assert 'Unsupported file type' in str(exc_info.value)
+    @pytest.mark.parametrize('path, needle', [
+        ('/path/to/file.ppt', 'PPT format not supported'),
+        ('/path/to/file.doc', 'DOC format not supported'),
+        ('/path/to/file.rtf', 'RTF format not supported'),
+        ('/path/to/file.xyz', 'Unsupported file type'),
+    ])
+    def test_unsupported_format(self, handler, path, needle):
+        """Test that legacy and unknown formats raise an error naming the problem."""
+        with pytest.raises(Exception) as exc_info:
+            handler._convert_to_pdf(path)
+        assert needle in str(exc_info.value)
 
 
 class TestUnicodeFonts:
@@ -211,45 +298,83 @@ class TestUnicodeFonts:
 
     def test_font_registration_method_exists(self):
         """Test that font registration method exists."""
-        from jupyterlab_doc_reader_extension.handlers import DocumentConverterHandler
-
         # Method should exist and be callable
         assert hasattr(DocumentConverterHandler, '_register_unicode_fonts')
         assert callable(DocumentConverterHandler._register_unicode_fonts)
 
-    def test_font_registration_runs_without_error(self):
-        """Test that font registration runs without error."""
-        from jupyterlab_doc_reader_extension.handlers import DocumentConverterHandler
+    def test_font_registration_runs_without_error(self, handler):
+        """Test that font registration runs without error and does not parse fonts again."""
+        from reportlab.pdfbase import pdfmetrics
 
-        with patch.object(DocumentConverterHandler, 'log', new_callable=PropertyMock) as mock_log:
-            mock_log.return_value = MagicMock()
-            handler = object.__new__(DocumentConverterHandler)
-            # Should not raise
+        # Fonts were registered once for the session; repeating it must not re-register
+        with patch.object(pdfmetrics, 'registerFont') as register_font:
             handler._register_unicode_fonts()
+        register_font.assert_not_called()
 
+    def test_font_registration_returns_cached_pair(self, handler):
+        """Test that repeated registration returns the same registered font names."""
+        from reportlab.pdfbase import pdfmetrics
 
-class TestImportAvailability:
-    """Test that required imports are available."""
+        first = handler._register_unicode_fonts()
+        second = handler._register_unicode_fonts()
+
+        assert first is second
+        registered = set(pdfmetrics.getRegisteredFontNames()) | set(pdfmetrics.standardFonts)
+        assert all(name in registered for name in first)
+
+    def test_font_scan_finds_fonts_outside_debian_paths(self, tmp_path):
+        """Test that font files are located by name anywhere under the font directories."""
+        nested = tmp_path / 'dejavu-sans-fonts'
+        nested.mkdir()
+        (nested / 'DejaVuSans.ttf').write_bytes(b'')
+        (tmp_path / 'Other.ttf').write_bytes(b'')
+
+        with patch.object(handlers, '_FONT_DIRS', (str(tmp_path), str(tmp_path / 'missing'))):
+            found = handlers._scan_font_dirs({'DejaVuSans.ttf', 'DejaVuSans-Bold.ttf'})
 
-    def test_reportlab_available(self):
-        """Test that reportlab imports are available."""
-        from jupyterlab_doc_reader_extension.handlers import REPORTLAB_AVAILABLE
-        assert REPORTLAB_AVAILABLE is True
+        assert found == {'DejaVuSans.ttf': str(nested / 'DejaVuSans.ttf')}
 
-    def test_docx_available(self):
-        """Test that python-docx imports are available."""
-        from jupyterlab_doc_reader_extension.handlers import DOCX_AVAILABLE
-        assert DOCX_AVAILABLE is True
+    def test_warm_up_runs_without_error(self):
+        """Test that the startup warm-up registers fonts and lays out a document."""
+        log = Mock(spec=logging.Logger)
+        handlers._warm_up(log)
+        assert not any('warm-up failed' in str(call) for call in log.debug.call_args_list)
 
-    def test_pptx_available(self):
-        """Test that python-pptx imports are available."""
-        from jupyterlab_doc_reader_extension.handlers import PPTX_AVAILABLE
-        assert PPTX_AVAILABLE is True
+    def test_styles_are_cached_per_font_pair(self):
+        """Test that paragraph styles are built once and reused."""
+        first = DocumentConverterHandler._get_styles('Helvetica', 'Helvetica-Bold')
+        second = DocumentConverterHandler._get_styles('Helvetica', 'Helvetica-Bold')
+        assert first is second
+        assert first['normal'].fontName == 'Helvetica'
+        assert first['heading1'].fontName == 'Helvetica-Bold'
+        assert first['table'] is second['table']
 
-    def test_pil_available(self):
-        """Test that PIL imports are available."""
-        from jupyterlab_doc_reader_extension.handlers import PIL_AVAILABLE
-        assert PIL_AVAILABLE is True
+
+class TestImportAvailability:
+    """Test that required imports are available."""
+
+    def test_libraries_are_imported_lazily(self):
+        """Test that importing the handlers module does not import the conversion libraries."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, jupyterlab_doc_reader_extension.handlers; "
+            "print(any(m in sys.modules for m in ('reportlab', 'docx', 'pptx', 'PIL')))"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == 'False'
+
+    @pytest.mark.parametrize('loader, flag', [
+        ('_load_reportlab', 'REPORTLAB_AVAILABLE'),
+        ('_load_docx', 'DOCX_AVAILABLE'),
+        ('_load_pptx', 'PPTX_AVAILABLE'),
+        ('_load_pil', 'PIL_AVAILABLE'),
+    ])
+    def test_library_available(self, loader, flag):
+        """Test that each conversion library loads and sets its availability flag."""
+        assert getattr(handlers, loader)() is True
+        assert getattr(handlers, flag) is True
 
 
 class TestPDFGeneration:
@@ -257,6 +382,8 @@ class TestPDFGeneration:
 
     def test_create_simple_pdf(self):
         """Test that we can create a simple PDF."""
+        from reportlab.pdfgen import canvas
+
         pdf_buffer = BytesIO()
         c = canvas.Canvas(pdf_buffer)
         c.drawString(100, 750, "Test PDF")
@@ -264,11 +391,14 @@ class TestPDFGeneration:
         c.save()
 
         pdf_bytes = pdf_buffer.getvalue()
-        assert pdf_bytes[:4] == b'%PDF'
+        assert pdf_bytes.startswith(b'%PDF')
         assert len(pdf_bytes) > 100
 
     def test_pdf_with_colors(self):
         """Test PDF generation with colors."""
+        from reportlab.pdfgen import canvas
+        from reportlab.lib import colors
+
         pdf_buffer = BytesIO()
         c = canvas.Canvas(pdf_buffer)
         c.setFillColor(colors.red)
@@ -279,16 +409,16 @@ class TestPDFGeneration:
         c.save()
 
         pdf_bytes = pdf_buffer.getvalue()
-        assert pdf_bytes[:4] == b'%PDF'
+        assert pdf_bytes.startswith(b'%PDF')
 
 
 class TestDocumentOrderPreservation:
     """Test that document elements are rendered in correct order."""
 
-    @pytest.fixture
-    def docx_with_inline_table(self):
+    @pytest.fixture(scope="module")
+    def docx_with_inline_table(self, tmp_path_factory):
         """Create a DOCX with paragraph, table, paragraph (in that order)."""
-        doc = Document()
+        doc = new_document()
         doc.add_heading('Title', level=1)
         doc.add_paragraph('Paragraph before table.')
 
@@ -305,36 +435,29 @@ class TestDocumentOrderPreservation:
         doc.add_heading('Section 2', level=2)
         doc.add_paragraph('Final paragraph.')
 
-        with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as f:
-            doc.save(f.name)
-            yield f.name
-
-        os.unlink(f.name)
+        path = str(tmp_path_factory.mktemp('inline_table') / 'document.docx')
+        doc.save(path)
+        return path
 
-    def test_table_position_preserved(self, docx_with_inline_table):
+    def test_table_position_preserved(self, handler, docx_with_inline_table):
         """Test that table appears inline between paragraphs, not at end."""
-        from jupyterlab_doc_reader_extension.handlers import DocumentConverterHandler
-
-        with patch.object(DocumentConverterHandler, 'log', new_callable=PropertyMock) as mock_log:
-            mock_log.return_value = MagicMock()
-            handler = object.__new__(DocumentConverterHandler)
-            pdf_bytes = handler._convert_docx_to_pdf(docx_with_inline_table)
+        pdf_bytes = handler._convert_docx_to_pdf(docx_with_inline_table)
 
         # PDF should be valid
-        assert pdf_bytes[:4] == b'%PDF'
+        assert pdf_bytes.startswith(b'%PDF')
 
-        # Extract text from PDF using pypdf
-        pdf_text = extract_pdf_text(pdf_bytes)
+        # Content streams draw the flowables top to bottom, so byte offsets give the order
+        content = pdf_page_contents(pdf_bytes)
 
         # Find positions of key elements
-        pos_before = pdf_text.find('Paragraph before table')
-        pos_header = pdf_text.find('Header1')
-        pos_after = pdf_text.find('Paragraph after table')
+        pos_before = content.find(b'Paragraph before table')
+        pos_header = content.find(b'Header1')
+        pos_after = content.find(b'Paragraph after table')
 
         # All elements should be found
-        assert pos_before != -1, f"'Paragraph before table' not found in PDF. Text: {pdf_text[:500]}"
-        assert pos_header != -1, f"'Header1' not found in PDF. Text: {pdf_text[:500]}"
-        assert pos_after != -1, f"'Paragraph after table' not found in PDF. Text: {pdf_text[:500]}"
+        assert pos_before != -1, f"'Paragraph before table' not found in PDF. Content: {content[:500]}"
+        assert pos_header != -1, f"'Header1' not found in PDF. Content: {content[:500]}"
+        assert pos_after != -1, f"'Paragraph after table' not found in PDF. Content: {content[:500]}"
 
         # Table content should appear between the two paragraphs
         assert pos_before < pos_header < pos_after, \
@@ -344,10 +467,10 @@ class TestDocumentOrderPreservation:
 class TestBoldItalicHandling:
     """Test bold and italic text formatting."""
 
-    @pytest.fixture
-    def docx_with_formatting(self):
+    @pytest.fixture(scope="module")
+    def docx_with_formatting(self, tmp_path_factory):
         """Create a DOCX with bold and italic text."""
-        doc = Document()
+        doc = new_document()
         doc.add_heading('Formatted Document', level=1)
 
         # Add paragraph with mixed formatting
@@ -364,41 +487,49 @@ class TestBoldItalicHandling:
         bold_italic_run.italic = True
         para.add_run('.')
 
-        with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as f:
-            doc.save(f.name)
-            yield f.name
-
-        os.unlink(f.name)
+        path = str(tmp_path_factory.mktemp('formatting') / 'document.docx')
+        doc.save(path)
+        return path
 
-    def test_formatted_text_renders(self, docx_with_formatting):
+    def test_formatted_text_renders(self, handler, docx_with_formatting):
         """Test that bold and italic text is processed."""
-        from jupyterlab_doc_reader_extension.handlers import DocumentConverterHandler
-
-        with patch.object(DocumentConverterHandler, 'log', new_callable=PropertyMock) as mock_log:
-            mock_log.return_value = MagicMock()
-            handler = object.__new__(DocumentConverterHandler)
-            pdf_bytes = handler._convert_docx_to_pdf(docx_with_formatting)
+        pdf_bytes = handler._convert_docx_to_pdf(docx_with_formatting)
 
         # PDF should be valid
-        assert pdf_bytes[:4] == b'%PDF'
+        assert pdf_bytes.startswith(b'%PDF')
         assert len(pdf_bytes) > 1000
 
-        # Extract text from PDF using pypdf
-        pdf_text = extract_pdf_text(pdf_bytes)
-
         # Check that content is present
-        assert 'Normal text' in pdf_text, f"'Normal text' not found. PDF text: {pdf_text[:500]}"
-        assert 'bold text' in pdf_text, f"'bold text' not found. PDF text: {pdf_text[:500]}"
-        assert 'italic text' in pdf_text, f"'italic text' not found. PDF text: {pdf_text[:500]}"
+        assert pdf_contains(pdf_bytes, b'Normal text')
+        assert pdf_contains(pdf_bytes, b'bold text')
+        assert pdf_contains(pdf_bytes, b'italic text')
 
+    def test_plain_text_keeps_special_characters(self, handler, tmp_path):
+        """Test that plain and multi-line paragraphs render markup characters literally."""
+        doc = new_document()
+        doc.add_paragraph('if a < b && c > d: pass')
+        doc.add_paragraph('first <line>\nsecond & last')
 
+        path = str(tmp_path / 'document.docx')
+        doc.save(path)
+
+        pdf_bytes = handler._convert_docx_to_pdf(path)
+
+        # Paragraph fragments may be drawn as separate strings, so compare extracted text
+        pdf_text = extract_pdf_text(pdf_bytes)
+        assert 'if a < b && c > d: pass' in pdf_text
+        assert 'first <line>' in pdf_text
+        assert 'second & last' in pdf_text
+
+
+@pytest.mark.xdist_group(name="lists")
 class TestListHandling:
     """Test bullet and numbered list handling."""
 
-    @pytest.fixture
-    def docx_with_lists(self):
+    @pytest.fixture(scope="module")
+    def docx_with_lists(self, tmp_path_factory):
         """Create a DOCX with bullet and numbered lists."""
-        doc = Document()
+        doc = new_document()
         doc.add_heading('Document with Lists', level=1)
 
         doc.add_paragraph('Introduction paragraph.')
@@ -417,56 +548,43 @@ class TestListHandling:
 
         doc.add_paragraph('Final paragraph.')
 
-        with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as f:
-            doc.save(f.name)
-            yield f.name
+        path = str(tmp_path_factory.mktemp('lists') / 'document.docx')
+        doc.save(path)
+        return path
 
-        os.unlink(f.name)
+    @pytest.fixture(scope="module")
+    def lists_pdf_bytes(self, handler, docx_with_lists):
+        """Convert the list document once for every test in the class."""
+        return handler._convert_docx_to_pdf(docx_with_lists)
 
-    def test_bullet_list_renders(self, docx_with_lists):
+    def test_bullet_list_renders(self, lists_pdf_bytes):
         """Test that bullet lists are rendered with bullet characters."""
-        from jupyterlab_doc_reader_extension.handlers import DocumentConverterHandler
-
-        with patch.object(DocumentConverterHandler, 'log', new_callable=PropertyMock) as mock_log:
-            mock_log.return_value = MagicMock()
-            handler = object.__new__(DocumentConverterHandler)
-            pdf_bytes = handler._convert_docx_to_pdf(docx_with_lists)
+        pdf_bytes = lists_pdf_bytes
 
         # PDF should be valid
-        assert pdf_bytes[:4] == b'%PDF'
-
-        # Extract text from PDF using pypdf
-        pdf_text = extract_pdf_text(pdf_bytes)
+        assert pdf_bytes.startswith(b'%PDF')
 
         # Check that list items are present
-        assert 'Bullet item 1' in pdf_text, f"'Bullet item 1' not found. PDF text: {pdf_text[:500]}"
-        assert 'Number item 1' in pdf_text, f"'Number item 1' not found. PDF text: {pdf_text[:500]}"
+        content = pdf_page_contents(pdf_bytes)
+        needles = {b'Bullet item 1', b'Number item 1'}
+        assert {needle for needle in needles if needle not in content} == set()
 
-    def test_numbered_list_has_numbers(self, docx_with_lists):
+    def test_numbered_list_has_numbers(self, lists_pdf_bytes):
         """Test that numbered lists have sequential numbers."""
-        from jupyterlab_doc_reader_extension.handlers import DocumentConverterHandler
+        content = pdf_page_contents(lists_pdf_bytes)
 
-        with patch.object(DocumentConverterHandler, 'log', new_callable=PropertyMock) as mock_log:
-            mock_log.return_value = MagicMock()
-            handler = object.__new__(DocumentConverterHandler)
-            pdf_bytes = handler._convert_docx_to_pdf(docx_with_lists)
-
-        # Extract text from PDF using pypdf
-        pdf_text = extract_pdf_text(pdf_bytes)
-
-        # Check for numbered list markers (1., 2., 3.)
-        assert '1.' in pdf_text and 'Number item 1' in pdf_text, f"Numbered list item 1 not found. Text: {pdf_text[:500]}"
-        assert '2.' in pdf_text and 'Number item 2' in pdf_text, f"Numbered list item 2 not found. Text: {pdf_text[:500]}"
-        assert '3.' in pdf_text and 'Number item 3' in pdf_text, f"Numbered list item 3 not found. Text: {pdf_text[:500]}"
+        # Each marker (1., 2., 3.) is drawn in the same string as its item
+        needles = {b'1. Number item 1', b'2. Number item 2', b'3. Number item 3'}
+        assert {needle for needle in needles if needle not in content} == set()
 
 
 class TestHeadingStyles:
     """Test heading style detection and rendering."""
 
-    @pytest.fixture
-    def docx_with_headings(self):
+    @pytest.fixture(scope="module")
+    def docx_with_headings(self, tmp_path_factory):
         """Create a DOCX with multiple heading levels."""
-        doc = Document()
+        doc = new_document()
         doc.add_heading('Main Title', level=0)
         doc.add_paragraph('Introduction.')
         doc.add_heading('Section 1', level=1)
@@ -476,40 +594,62 @@ class TestHeadingStyles:
         doc.add_heading('Sub-subsection', level=3)
         doc.add_paragraph('Deep content.')
 
-        with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as f:
-            doc.save(f.name)
-            yield f.name
+        path = str(tmp_path_factory.mktemp('headings') / 'document.docx')
+        doc.save(path)
+        return path
 
-        os.unlink(f.name)
-
-    def test_headings_are_rendered(self, docx_with_headings):
+    def test_headings_are_rendered(self, handler, docx_with_headings):
         """Test that all heading levels are rendered."""
-        from jupyterlab_doc_reader_extension.handlers import DocumentConverterHandler
-
-        with patch.object(DocumentConverterHandler, 'log', new_callable=PropertyMock) as mock_log:
-            mock_log.return_value = MagicMock()
-            handler = object.__new__(DocumentConverterHandler)
-            pdf_bytes = handler._convert_docx_to_pdf(docx_with_headings)
+        pdf_bytes = handler._convert_docx_to_pdf(docx_with_headings)
 
         # PDF should be valid
-        assert pdf_bytes[:4] == b'%PDF'
-
-        # Extract text from PDF using pypdf
-        pdf_text = extract_pdf_text(pdf_bytes)
+        assert pdf_bytes.startswith(b'%PDF')
 
         # Check that all headings are present
-        assert 'Main Title' in pdf_text, f"'Main Title' not found. PDF text: {pdf_text[:500]}"
-        assert 'Section 1' in pdf_text, f"'Section 1' not found. PDF text: {pdf_text[:500]}"
-        assert 'Subsection 1.1' in pdf_text, f"'Subsection 1.1' not found. PDF text: {pdf_text[:500]}"
+        assert pdf_contains(pdf_bytes, b'Main Title')
+        assert pdf_contains(pdf_bytes, b'Section 1')
+        assert pdf_contains(pdf_bytes, b'Subsection 1.1')
+
+
+class TestHorizontalRules:
+    """Test paragraph-border divider handling."""
+
+    @pytest.fixture(scope="module")
+    def docx_with_dividers(self, tmp_path_factory):
+        """Create a DOCX with several empty bordered paragraphs between text."""
+        from docx.oxml import parse_xml
+        from docx.oxml.ns import nsdecls
+
+        doc = new_document()
+        for idx in range(3):
+            doc.add_paragraph(f'Block {idx}')
+            divider = doc.add_paragraph()
+            divider._p.get_or_add_pPr().append(parse_xml(
+                f'<w:pBdr {nsdecls("w")}><w:bottom w:val="single" w:sz="6" w:space="1" w:color="auto"/></w:pBdr>'
+            ))
+
+        path = str(tmp_path_factory.mktemp('dividers') / 'document.docx')
+        doc.save(path)
+        return path
+
+    def test_every_divider_is_drawn(self, handler, docx_with_dividers):
+        """Test that each divider paragraph draws its own rule line."""
+        pdf_bytes = handler._convert_docx_to_pdf(docx_with_dividers)
+
+        reader = PdfReader(BytesIO(pdf_bytes))
+        content = reader.pages[0].get_contents().get_data()
+        assert content.count(b' l S') == 3
+        for idx in range(3):
+            assert pdf_contains(pdf_bytes, b'Block %d' % idx)
 
 
 class TestTableStyling:
     """Test table styling and formatting."""
 
-    @pytest.fixture
-    def docx_with_styled_table(self):
+    @pytest.fixture(scope="module")
+    def docx_with_styled_table(self, tmp_path_factory):
         """Create a DOCX with a styled table."""
-        doc = Document()
+        doc = new_document()
         doc.add_heading('Table Test', level=1)
 
         table = doc.add_table(rows=3, cols=4)
@@ -528,30 +668,363 @@ class TestTableStyling:
         table.cell(2, 2).text = 'Age in years'
         table.cell(2, 3).text = '25'
 
-        with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as f:
-            doc.save(f.name)
-            yield f.name
+        path = str(tmp_path_factory.mktemp('styled_table') / 'document.docx')
+        doc.save(path)
+        return path
 
-        os.unlink(f.name)
-
-    def test_table_content_preserved(self, docx_with_styled_table):
+    def test_table_content_preserved(self, handler, docx_with_styled_table):
         """Test that table content is preserved in PDF."""
-        from jupyterlab_doc_reader_extension.handlers import DocumentConverterHandler
-
-        with patch.object(DocumentConverterHandler, 'log', new_callable=PropertyMock) as mock_log:
-            mock_log.return_value = MagicMock()
-            handler = object.__new__(DocumentConverterHandler)
-            pdf_bytes = handler._convert_docx_to_pdf(docx_with_styled_table)
+        pdf_bytes = handler._convert_docx_to_pdf(docx_with_styled_table)
 
         # PDF should be valid
-        assert pdf_bytes[:4] == b'%PDF'
-
-        # Extract text from PDF using pypdf
-        pdf_text = extract_pdf_text(pdf_bytes)
+        assert pdf_bytes.startswith(b'%PDF')
 
         # Check that table content is present
-        assert 'Field' in pdf_text, f"'Field' not found. PDF text: {pdf_text[:500]}"
-        assert 'Type' in pdf_text, f"'Type' not found. PDF text: {pdf_text[:500]}"
-        assert 'Description' in pdf_text, f"'Description' not found. PDF text: {pdf_text[:500]}"
-        assert 'name' in pdf_text, f"'name' not found. PDF text: {pdf_text[:500]}"
-        assert 'string' in pdf_text, f"'string' not found. PDF text: {pdf_text[:500]}"
+        assert pdf_contains(pdf_bytes, b'Field')
+        assert pdf_contains(pdf_bytes, b'Type')
+        assert pdf_contains(pdf_bytes, b'Description')
+        assert pdf_contains(pdf_bytes, b'name')
+        assert pdf_contains(pdf_bytes, b'string')
+
+    def test_pptx_table_cells_rendered_and_truncated(self, handler, tmp_path):
+        """Test that PPTX table cells are drawn and long text is truncated to the column."""
+        from pptx.util import Inches
+
+        prs = new_presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        shape = slide.shapes.add_table(2, 2, Inches(1), Inches(1), Inches(4), Inches(1))
+        table = shape.table
+        table.cell(0, 0).text = 'Header'
+        table.cell(0, 1).text = 'Value'
+        table.cell(1, 0).text = 'Row'
+        table.cell(1, 1).text = 'x' * 200
+
+        path = str(tmp_path / 'document.pptx')
+        prs.save(path)
+
+        pdf_bytes = handler._convert_pptx_to_pdf(path)
+
+        assert pdf_contains(pdf_bytes, b'Header')
+        assert pdf_contains(pdf_bytes, b'Row')
+        assert pdf_contains(pdf_bytes, b'x' * 20)
+        assert not pdf_contains(pdf_bytes, b'x' * 200)
+
+    def test_cell_text_fits_measured_width(self):
+        """Test that cell text is truncated by measured glyph width, not character count."""
+        from reportlab.pdfbase import pdfmetrics
+
+        handlers._load_reportlab()
+        assert handlers._fit_text('short', 'Helvetica', 9, 100) == 'short'
+
+        narrow = handlers._fit_text('i' * 100, 'Helvetica', 9, 100)
+        wide = handlers._fit_text('W' * 100, 'Helvetica', 9, 100)
+        assert narrow.endswith('..') and wide.endswith('..')
+        assert len(narrow) > len(wide)
+        for fitted in (narrow, wide):
+            assert pdfmetrics.stringWidth(fitted, 'Helvetica', 9) <= 100
+
+
+class TestImageHandling:
+    """Test embedded DOCX image handling."""
+
+    @pytest.fixture(scope="module")
+    def docx_with_large_image(self, tmp_path_factory):
+        """Create a DOCX embedding a high-resolution photo."""
+        from PIL import Image
+
+        image_buffer = BytesIO()
+        Image.effect_noise((2400, 1600), 64).convert('RGB').save(image_buffer, format='JPEG', quality=95)
+        image_buffer.seek(0)
+
+        doc = new_document()
+        doc.add_paragraph('Paragraph with photo.')
+        doc.add_picture(image_buffer)
+
+        path = str(tmp_path_factory.mktemp('large_image') / 'document.docx')
+        doc.save(path)
+        return path, len(image_buffer.getvalue())
+
+    def test_large_image_is_downscaled(self, handler, docx_with_large_image):
+        """Test that oversized images are resampled before embedding."""
+        docx_path, image_size = docx_with_large_image
+        pdf_bytes = handler._convert_docx_to_pdf(docx_path)
+
+        assert pdf_bytes.startswith(b'%PDF')
+        assert b'/Subtype /Image' in pdf_bytes
+        # 7.5 inches at 150 DPI is far fewer pixels than the 2400px source
+        assert len(pdf_bytes) < image_size / 2
+
+    def test_repeated_image_flows_across_pages(self, handler, tmp_path):
+        """Test that one picture repeated until it spills onto later pages still converts."""
+        from PIL import Image
+
+        image_buffer = BytesIO()
+        Image.new('RGB', (400, 300), 'red').save(image_buffer, format='PNG')
+
+        doc = new_document()
+        for idx in range(12):
+            doc.add_paragraph(f'Paragraph {idx}')
+            image_buffer.seek(0)
+            doc.add_picture(image_buffer)
+
+        path = str(tmp_path / 'document.docx')
+        doc.save(path)
+
+        pdf_bytes = handler._convert_docx_to_pdf(path)
+
+        assert len(PdfReader(BytesIO(pdf_bytes)).pages) > 1
+
+    def test_identical_images_are_resampled_once(self, handler, tmp_path):
+        """Test that identical images in separate parts are resampled once and each drawn."""
+        from docx.opc.constants import RELATIONSHIP_TYPE as RT
+        from docx.opc.packuri import PackURI
+        from docx.oxml.ns import qn
+        from docx.parts.image import ImagePart
+        from PIL import Image
+
+        image_buffer = BytesIO()
+        Image.effect_noise((2000, 1500), 64).convert('RGB').save(image_buffer, format='JPEG')
+        blob = image_buffer.getvalue()
+
+        # python-docx shares one part per image, so add the copy as its own part
+        doc = new_document()
+        doc.add_picture(BytesIO(blob))
+        first = doc.paragraphs[-1]._p
+        copy_part = ImagePart(PackURI('/word/media/copy.jpeg'), 'image/jpeg', blob, doc.part.package)
+        second = copy.deepcopy(first)
+        second.find('.//' + qn('a:blip')).set(qn('r:embed'), doc.part.relate_to(copy_part, RT.IMAGE))
+        first.addnext(second)
+
+        path = str(tmp_path / 'document.docx')
+        doc.save(path)
+
+        with patch.object(
+            Image.Image, 'thumbnail', autospec=True, side_effect=Image.Image.thumbnail
+        ) as thumbnail:
+            pdf_bytes = handler._convert_docx_to_pdf(path)
+
+        assert thumbnail.call_count == 1
+        assert pdf_page_contents(pdf_bytes).count(b' Do') == 2
+
+    @pytest.fixture(scope="module")
+    def pptx_with_pictures(self, tmp_path_factory):
+        """Create a PPTX with a picture on each of several slides."""
+        from pptx.util import Inches
+        from PIL import Image
+
+        prs = new_presentation()
+        for color in ('red', 'green', 'blue'):
+            image_buffer = BytesIO()
+            Image.new('RGBA', (64, 48), color).save(image_buffer, format='PNG')
+            image_buffer.seek(0)
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            slide.shapes.add_picture(image_buffer, Inches(1), Inches(1))
+
+        path = str(tmp_path_factory.mktemp('pictures') / 'document.pptx')
+        prs.save(path)
+        return path
+
+    def test_pptx_pictures_are_embedded(self, handler, pptx_with_pictures):
+        """Test that pictures decoded in parallel land on every slide."""
+        pdf_bytes = handler._convert_pptx_to_pdf(pptx_with_pictures)
+
+        reader = PdfReader(BytesIO(pdf_bytes))
+        assert len(reader.pages) == 3
+        for page in reader.pages:
+            assert len(page.images) == 1
+        # The RGBA pictures keep their alpha channel as a soft mask
+        assert pdf_bytes.count(b'/SMask') == 3
+
+    def test_pptx_pictures_are_decoded_one_slide_ahead(self, handler, pptx_with_pictures):
+        """Test that picture decoding runs at most one slide ahead of drawing."""
+        submit = handlers._picture_executor.submit
+        render_picture = DocumentConverterHandler._render_picture
+        submitted = []
+        submitted_at_draw = []
+
+        def recording_submit(*args, **kwargs):
+            submitted.append(args)
+            return submit(*args, **kwargs)
+
+        def recording_render_picture(self, *args):
+            submitted_at_draw.append(len(submitted))
+            return render_picture(self, *args)
+
+        with patch.object(handlers._picture_executor, 'submit', recording_submit), \
+                patch.object(DocumentConverterHandler, '_render_picture', recording_render_picture):
+            handler._convert_pptx_to_pdf(pptx_with_pictures)
+
+        assert submitted_at_draw == [2, 3, 3]
+
+    def test_pptx_jpeg_is_embedded_without_reencoding(self, handler, tmp_path):
+        """Test that JPEG pictures are passed through to the PDF as DCT data."""
+        from pptx.util import Inches
+        from PIL import Image
+
+        image_buffer = BytesIO()
+        Image.effect_noise((320, 240), 64).convert('RGB').save(image_buffer, format='JPEG')
+        image_buffer.seek(0)
+
+        prs = new_presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_picture(image_buffer, Inches(1), Inches(1))
+
+        path = str(tmp_path / 'document.pptx')
+        prs.save(path)
+
+        pdf_bytes = handler._convert_pptx_to_pdf(path)
+
+        assert b'/DCTDecode' in pdf_bytes
+
+    def test_pptx_repeated_picture_is_decoded_once(self, handler, tmp_path):
+        """Test that the same image on several slides is decoded only once."""
+        from pptx.util import Inches
+        from PIL import Image
+        image_buffer = BytesIO()
+        Image.new('RGB', (64, 48), 'red').save(image_buffer, format='PNG')
+
+        prs = new_presentation()
+        for _ in range(3):
+            image_buffer.seek(0)
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            slide.shapes.add_picture(image_buffer, Inches(1), Inches(1))
+
+        path = str(tmp_path / 'document.pptx')
+        prs.save(path)
+
+        with patch.object(
+            DocumentConverterHandler, '_load_picture',
+            autospec=True, side_effect=DocumentConverterHandler._load_picture
+        ) as load_picture:
+            pdf_bytes = handler._convert_pptx_to_pdf(path)
+
+        assert load_picture.call_count == 1
+        reader = PdfReader(BytesIO(pdf_bytes))
+        assert len(reader.pages) == 3
+        for page in reader.pages:
+            assert len(page.images) == 1
+
+
+class TestConvertEndpoint:
+    """Test the streamed JSON response of the convert endpoint."""
+
+    @pytest.fixture(autouse=True)
+    def _jupyter_server_plugin(self, request):
+        """Skip unless pytest-jupyter is loaded (root conftest.py or -p pytest_jupyter.jupyter_server)."""
+        if not request.config.pluginmanager.hasplugin('pytest_jupyter.jupyter_server'):
+            pytest.skip("endpoint tests need the pytest_jupyter.jupyter_server plugin")
+
+    @pytest.fixture
+    def jp_server_config(self):
+        """Enable the extension on the test server (the root conftest.py is cut off in CI)."""
+        return {"ServerApp": {"jpserver_extensions": {"jupyterlab_doc_reader_extension": True}}}
+
+    async def test_convert_streams_valid_json(self, jp_fetch, jp_root_dir):
+        """Test that the streamed envelope decodes to the original PDF."""
+        import json
+
+        doc = new_document()
+        doc.add_paragraph('Streamed paragraph.')
+        doc.save(str(jp_root_dir / 'streamed.docx'))
+
+        response = await jp_fetch(
+            'jupyterlab-doc-reader-extension', 'convert',
+            method='POST',
+            body=json.dumps({'path': 'streamed.docx'})
+        )
+
+        assert response.code == 200
+        payload = json.loads(response.body)
+        assert payload['success'] is True
+        assert payload['filename'] == 'streamed.pdf'
+        pdf_bytes = base64.b64decode(payload['pdf_data'], validate=True)
+        assert pdf_bytes.startswith(b'%PDF')
+        assert pdf_contains(pdf_bytes, b'Streamed paragraph')
+
+    async def test_missing_file_returns_json_error(self, jp_fetch):
+        """Test that a missing document yields a 404 with a JSON error body."""
+        import json
+        from tornado.httpclient import HTTPClientError
+
+        with pytest.raises(HTTPClientError) as exc_info:
+            await jp_fetch(
+                'jupyterlab-doc-reader-extension', 'convert',
+                method='POST',
+                body=json.dumps({'path': 'missing.docx'})
+            )
+
+        assert exc_info.value.code == 404
+        payload = json.loads(exc_info.value.response.body)
+        assert payload['error'] == 'File not found: missing.docx'
+
+    async def test_error_after_streaming_started_closes_connection(self, jp_fetch, jp_root_dir):
+        """Test that a failure mid-stream drops the connection instead of appending a JSON error."""
+        import json
+        from tornado.httpclient import HTTPClientError
+
+        doc = new_document()
+        doc.add_paragraph('Interrupted paragraph.')
+        doc.save(str(jp_root_dir / 'interrupted.docx'))
+
+        def failing_chunks(data, size):
+            yield data[:size]
+            raise RuntimeError("encoder failed")
+
+        with patch.object(handlers, '_iter_chunks', failing_chunks), \
+                pytest.raises(HTTPClientError) as exc_info:
+            await jp_fetch(
+                'jupyterlab-doc-reader-extension', 'convert',
+                method='POST',
+                body=json.dumps({'path': 'interrupted.docx'})
+            )
+
+        # The 200 headers were already sent, so the client sees a dropped
+        # connection (599) rather than a JSON error spliced into the stream
+        assert exc_info.value.code == 599
+
+    async def test_conversion_runs_off_event_loop(self, jp_fetch, jp_root_dir):
+        """Test that conversion is executed on a worker thread."""
+        import json
+        import threading
+        doc = new_document()
+        doc.add_paragraph('Threaded paragraph.')
+        doc.save(str(jp_root_dir / 'threaded.docx'))
+
+        convert = DocumentConverterHandler._convert_to_pdf
+        thread_names = []
+
+        def recording_convert(self, input_path):
+            thread_names.append(threading.current_thread().name)
+            return convert(self, input_path)
+
+        with patch.object(DocumentConverterHandler, '_convert_to_pdf', recording_convert):
+            response = await jp_fetch(
+                'jupyterlab-doc-reader-extension', 'convert',
+                method='POST',
+                body=json.dumps({'path': 'threaded.docx'})
+            )
+
+        assert response.code == 200
+        assert len(thread_names) == 1
+        assert thread_names[0].startswith('doc-reader-convert')
+
+    async def test_convert_raw_returns_pdf_bytes(self, jp_fetch, jp_root_dir):
+        """Test that raw=1 returns the PDF itself instead of the JSON envelope."""
+        import json
+
+        doc = new_document()
+        doc.add_paragraph('Raw paragraph.')
+        doc.save(str(jp_root_dir / 'raw.docx'))
+
+        response = await jp_fetch(
+            'jupyterlab-doc-reader-extension', 'convert',
+            method='POST',
+            params={'raw': '1'},
+            body=json.dumps({'path': 'raw.docx'})
+        )
+
+        assert response.code == 200
+        assert response.headers['Content-Type'] == 'application/pdf'
+        assert 'raw.pdf' in response.headers['Content-Disposition']
+        assert response.body.startswith(b'%PDF')
+        assert pdf_contains(response.body, b'Raw paragraph')
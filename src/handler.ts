@@ -3,23 +3,24 @@ import { URLExt } from '@jupyterlab/coreutils';
 import { ServerConnection } from '@jupyterlab/services';
 
 /**
- * Call the API extension
+ * Call the API extension for a binary PDF response
  *
  * @param endPoint API REST end point for the extension
  * @param init Initial values for the request
- * @returns The response body interpreted as JSON
+ * @returns The response body as a PDF Blob
  */
-export async function requestAPI<T>(
+export async function requestPDF(
   endPoint = '',
   init: RequestInit = {}
-): Promise<T> {
-  // Make request to Jupyter API
+): Promise<Blob> {
+  // Make request to Jupyter API, asking for the raw PDF bytes
   const settings = ServerConnection.makeSettings();
-  const requestUrl = URLExt.join(
-    settings.baseUrl,
-    'jupyterlab-doc-reader-extension', // API Namespace
-    endPoint
-  );
+  const requestUrl =
+    URLExt.join(
+      settings.baseUrl,
+      'jupyterlab-doc-reader-extension', // API Namespace
+      endPoint
+    ) + '?raw=1';
 
   let response: Response;
   try {
@@ -28,19 +29,18 @@ export async function requestAPI<T>(
     throw new ServerConnection.NetworkError(error as any);
   }
 
-  let data: any = await response.text();
-
-  if (data.length > 0) {
-    try {
-      data = JSON.parse(data);
-    } catch (error) {
-      console.log('Not a JSON response body.', response);
-    }
-  }
-
   if (!response.ok) {
+    // Errors are still reported as JSON
+    let data: any = await response.text();
+    if (data.length > 0) {
+      try {
+        data = JSON.parse(data);
+      } catch (error) {
+        console.log('Not a JSON response body.', response);
+      }
+    }
     throw new ServerConnection.ResponseError(response, data.message || data);
   }
 
-  return data;
+  return response.blob();
 }
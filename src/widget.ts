@@ -2,7 +2,7 @@ import { DocumentWidget } from '@jupyterlab/docregistry';
 import { ABCWidgetFactory, DocumentRegistry } from '@jupyterlab/docregistry';
 import { PromiseDelegate } from '@lumino/coreutils';
 import { Widget } from '@lumino/widgets';
-import { requestAPI } from './handler';
+import { requestPDF } from './handler';
 
 /**
  * A widget for displaying document files (DOCX, DOC, RTF, PPTX, PPT) as PDFs
@@ -69,18 +69,13 @@ export class DocReaderWidget extends Widget {
 
       // Request conversion from server
       console.log('[DocReader] Requesting conversion for:', path);
-      let response: any;
+      let pdfBlob: Blob;
       try {
-        response = await requestAPI<any>('convert', {
+        pdfBlob = await requestPDF('convert', {
           method: 'POST',
           body: JSON.stringify({ path })
         });
-        console.log('[DocReader] Received response:', {
-          success: response?.success,
-          hasPdfData: !!response?.pdf_data,
-          pdfDataLength: response?.pdf_data?.length,
-          filename: response?.filename
-        });
+        console.log('[DocReader] Received PDF. Size:', pdfBlob.size, 'bytes');
       } catch (apiError: any) {
         // Try to parse error response
         console.error('[DocReader] API request failed:', apiError);
@@ -96,16 +91,7 @@ export class DocReaderWidget extends Widget {
         throw apiError;
       }
 
-      if (response.success && response.pdf_data) {
-        console.log('[DocReader] Processing PDF data...');
-        // Create a blob from the base64 PDF data
-        console.log('[DocReader] Converting base64 to blob...');
-        const pdfBlob = this._base64ToBlob(
-          response.pdf_data,
-          'application/pdf'
-        );
-        console.log('[DocReader] Created blob. Size:', pdfBlob.size, 'bytes');
-
+      if (pdfBlob.size > 0) {
         const pdfUrl = URL.createObjectURL(pdfBlob);
         console.log('[DocReader] Created object URL:', pdfUrl);
 
@@ -133,12 +119,9 @@ export class DocReaderWidget extends Widget {
         this._ready.resolve();
         console.log('[DocReader] Document loading complete');
       } else {
-        // Response indicates failure
-        console.error(
-          '[DocReader] Response missing success or pdf_data:',
-          response
-        );
-        throw response;
+        // Response carried no PDF data
+        console.error('[DocReader] Received empty PDF response');
+        throw new Error('Conversion returned an empty PDF');
       }
     } catch (error) {
       console.error('Error loading document:', error);
@@ -147,21 +130,6 @@ export class DocReaderWidget extends Widget {
     }
   }
 
-  /**
-   * Convert base64 string to Blob
-   */
-  private _base64ToBlob(base64: string, contentType: string): Blob {
-    const byteCharacters = atob(base64);
-    const byteNumbers = new Array(byteCharacters.length);
-
-    for (let i = 0; i < byteCharacters.length; i++) {
-      byteNumbers[i] = byteCharacters.charCodeAt(i);
-    }
-
-    const byteArray = new Uint8Array(byteNumbers);
-    return new Blob([byteArray], { type: contentType });
-  }
-
   /**
    * Show error message
    */